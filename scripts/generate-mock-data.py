@@ -9,40 +9,167 @@ Generates realistic mock data following the production-ready "Four-Call" pattern
 
 This simulates how a real API would work: incremental data loading for performance.
 
-Requirements: pip install faker
+Requirements: pip install faker (only for the "faker" backend; --light uses bundled tables)
 
 Usage:
   python scripts/generate-mock-data.py          # Full dataset (local development - 1032 forms)
   python scripts/generate-mock-data.py --light  # Light dataset (Netlify builds - 24 forms)
   python scripts/generate-mock-data.py --scale  # Scale test (1300 forms, 800 entities, 1000+ queries)
+  python scripts/generate-mock-data.py --light --ticks 24  # Plus 24 incremental change batches
+  python scripts/generate-mock-data.py --partition 2/4 # Slice 2 of 4 (run 1/4..4/4 anywhere, then --merge 4)
   
 Modes:
   --light: Generates 24 forms with ~114 preview files (fast, for CI/CD)
   default: Generates 1032 forms (24 base × 43 variations) for local testing
   --scale: Generates 1300 forms with 800+ entities for performance testing
+
+Value backends (--backend):
+  tables: Bundled name/word tables drawn with stdlib random (fast start, no Faker import)
+  faker:  Faker, imported lazily only when this backend is selected
+  auto:   tables for --light (Netlify builds), faker otherwise (default)
+
+Partitioned builds (--partition K/N, --merge N):
+  Forms are ordered by category (domain) and split into N contiguous slices.
+  Each slice writes its summaries, metadata, previews and graph to
+  partitions/part-K-of-N/, seeded from --seed and K/N with relative dates pinned
+  to --anchor-date (default 2026-01-01), so it is deterministic on any machine.
+  --merge N stitches the slices into the usual top-level files, renumbers graph
+  node ids, merges shared entities and adds cross-partition entity links.
+
+Preview deduplication (--dedup):
+  Preview payloads are seeded per (entity name, query, record count), so the
+  43 variations of a base form produce identical records. Record/schema bodies
+  are stored once under blobs/{sha256}.json and preview-index.json maps
+  entityId -> queryId -> {hash, totalCount}. The run summary reports the dedup
+  ratio and bytes saved. The Angular app (SelectionDataService.getPreviewData)
+  still requests preview-data-*.json, so --dedup trees are for the Python
+  tooling only for now. Each run removes the other layout's leftover files.
+
+Query stats (--stats):
+  Writes stats-{entityId}-{queryId}.json per query with facet counts (status,
+  riskLevel, accountType, ...) and numeric aggregates (count/min/max/sum/mean,
+  quantiles, histogram) over the query's full estimatedResults rows, so
+  aggregate widgets load without fetching records.
+
+Change feed (--ticks N):
+  Advances simulated time over N ticks after the snapshot is written. Each tick
+  mutates a fraction of queries (estimatedResults, lastRun) and preview records
+  and writes changes/delta-{tick}.json with a version vector, so clients can
+  test incremental merge against a full reload.
 """
 
+import time
+
+_SCRIPT_START = time.perf_counter()
+
 import json
 import uuid
+import hashlib
 import random
 import os
 import argparse
+from array import array
+from bisect import bisect_left
+from collections import Counter
 from datetime import datetime, timedelta
-from faker import Faker
 
-fake = Faker()
+from mock_data_tables import TableFaker, resolve_relative_date
+
+# Value source for names, words and dates; set by set_fake_backend() before generation
+fake = None
 
 # Configuration
 BASE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src", "assets", "magic-selector-data")
 os.makedirs(BASE_DIR, exist_ok=True)
 
-def save_json(filename, data):
-    """Save data to JSON file with pretty formatting"""
-    filepath = os.path.join(BASE_DIR, filename)
+# Where save_json writes; BASE_DIR unless a partition slice is being generated
+OUTPUT_DIR = BASE_DIR
+
+# Reference time for relative dates ('-7d', 'now') in seeded runs without --anchor-date.
+# Fixed rather than "today" so slices built on different days/timezones still match.
+SEEDED_ANCHOR = datetime(2026, 1, 1)
+
+class AnchoredFaker:
+    """Faker wrapper that resolves relative dates ('-7d', 'now') against a fixed anchor
+
+    Faker resolves them against the wall clock, so two otherwise identical
+    seeded payloads drift by the seconds between them. Everything except the
+    two date methods is delegated to the wrapped Faker instance.
+    """
+
+    def __init__(self, faker, now):
+        self.faker = faker
+        self.now = now
+
+    def __getattr__(self, name):
+        return getattr(self.faker, name)
+
+    def date_time_between(self, start_date="-30y", end_date="now"):
+        return self.faker.date_time_between(start_date=resolve_relative_date(start_date, self.now),
+                                            end_date=resolve_relative_date(end_date, self.now))
+
+    def date_between(self, start_date="-30y", end_date="today"):
+        return self.faker.date_between(start_date=resolve_relative_date(start_date, self.now),
+                                       end_date=resolve_relative_date(end_date, self.now))
+
+def set_fake_backend(backend, seed=None, anchor=None):
+    """Select the value source used for names, words and dates
+
+    Args:
+        backend: 'tables' for the bundled stdlib-random tables, 'faker' for Faker
+                 (imported here, so the tables backend never pays for it)
+        seed: Optional seed for Faker (the tables backend follows `random`)
+        anchor: Optional datetime that relative dates resolve against, for either
+                backend (None = wall clock)
+
+    Returns:
+        Seconds spent importing/initializing the backend
+    """
+    global fake
+    started = time.perf_counter()
+    if backend == 'faker':
+        from faker import Faker
+        fake = Faker()
+        if seed is not None:
+            fake.seed_instance(seed)
+        if anchor is not None:
+            fake = AnchoredFaker(fake, anchor)
+    elif backend == 'tables':
+        fake = TableFaker(now=anchor)
+    else:
+        raise ValueError(f"Unknown backend: {backend}")
+    return time.perf_counter() - started
+
+def save_json(filename, data, compact=False, quiet=False):
+    """Save data to JSON file with pretty formatting
+
+    Args:
+        filename: Path relative to OUTPUT_DIR
+        data: JSON-serializable data
+        compact: Write without indentation/whitespace (for delta files)
+        quiet: Skip the per-file progress line
+    """
+    filepath = os.path.join(OUTPUT_DIR, filename)
     with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    record_count = len(data) if isinstance(data, list) else len(data) if isinstance(data, dict) else "N/A"
-    print(f"[OK] Generated {filename} ({record_count} records)")
+        if isinstance(data, CompactGraph):
+            data.write_json(f)
+        elif compact:
+            json.dump(data, f, separators=(',', ':'), ensure_ascii=False, default=_json_default)
+        else:
+            json.dump(data, f, indent=2, ensure_ascii=False, default=_json_default)
+    if quiet:
+        return
+    if isinstance(data, CompactGraph):
+        print(f"[OK] Generated {filename} ({data.node_count} nodes, {data.link_count} links)")
+    else:
+        record_count = len(data) if isinstance(data, list) else len(data) if isinstance(data, dict) else "N/A"
+        print(f"[OK] Generated {filename} ({record_count} records)")
+
+def _json_default(obj):
+    """Serialize compact internal structures (RecordTable) at write time"""
+    if hasattr(obj, "to_json"):
+        return obj.to_json()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 def generate_realistic_forms(limit=None):
     """Generate Call A: Form summaries with wealth management entities
@@ -290,8 +417,85 @@ def generate_form_metadata(form_summaries):
     
     return metadata_dict
 
-def generate_preview_data_for_query(entity_name, query_id, estimated_results):
-    """Generate Call C: Preview records for a specific entity/query combination"""
+# Value distributions for categorical (facet) and numeric preview fields.
+# Shared by the preview records and the per-query stats files.
+FACET_VALUES = {
+    "status": ["Active", "Inactive", "Pending", "Completed"],
+    "riskLevel": ["Conservative", "Moderate", "Aggressive", "Very Aggressive"],
+    "riskTolerance": ["Conservative", "Moderate", "Aggressive"],
+    "accountType": ["IRA", "Roth IRA", "401k", "Taxable", "Trust", "529 Plan"],
+    "symbol": ["AAPL", "MSFT", "GOOGL", "AMZN", "TSLA", "VTI", "SPY", "QQQ"],
+    "tradeType": ["Buy", "Sell", "Transfer In", "Transfer Out"],
+    "benchmark": ["S&P 500", "MSCI World", "60/40 Portfolio", "Russell 2000"],
+    "timeHorizon": ["<3 years", "3-5 years", "5-10 years", "10+ years"],
+    "liquidityNeeds": ["Low", "Medium", "High"],
+    "investmentExperience": ["None", "Limited", "Moderate", "Extensive"],
+    "type": ["Standard", "Premium", "Basic"],
+    "category": ["Type A", "Type B", "Type C"]
+}
+
+# field -> (low, high, decimals); decimals None draws integers
+NUMERIC_RANGES = {
+    "totalValue": (100000, 15000000, 2),
+    "cashBalance": (5000, 500000, 2),
+    "ytdReturn": (-12.5, 28.5, 2),
+    "aum": (250000, 20000000, 2),
+    "currentValue": (50000, 5000000, 2),
+    "costBasis": (40000, 4500000, 2),
+    "unrealizedGain": (-50000, 800000, 2),
+    "price": (50, 500, 2),
+    "totalReturn": (-8.5, 32.5, 2),
+    "alpha": (-3.0, 5.0, 2),
+    "sharpeRatio": (0.5, 2.5, 2),
+    "value": (100, 10000, 2),
+    "quantity": (10, 1000, None),
+    "riskScore": (1, 100, None)
+}
+
+def sample_field(field):
+    """Draw one value for a facet or numeric field"""
+    if field in FACET_VALUES:
+        return random.choice(FACET_VALUES[field])
+    low, high, decimals = NUMERIC_RANGES[field]
+    if decimals is None:
+        return random.randint(low, high)
+    return round(random.uniform(low, high), decimals)
+
+class RecordTable:
+    """Preview records stored as row tuples sharing a single field list
+
+    Serialized to the usual list of record dicts only at write time
+    (save_json calls to_json()).
+    """
+
+    __slots__ = ("fields", "rows")
+
+    def __init__(self, fields, rows=None):
+        self.fields = fields
+        self.rows = rows if rows is not None else []
+
+    def __len__(self):
+        return len(self.rows)
+
+    def column(self, field):
+        """Return all values of one field"""
+        position = self.fields.index(field)
+        return [row[position] for row in self.rows]
+
+    def to_json(self):
+        fields = self.fields
+        return [dict(zip(fields, row)) for row in self.rows]
+
+def generate_preview_data_for_query(entity_name, query_id, estimated_results, entity_id=None):
+    """Generate Call C: Preview records for a specific entity/query combination
+    
+    Args:
+        entity_name: Base entity name (selects the field schema)
+        query_id: Query identifier
+        estimated_results: Total count reported for the query
+        entity_id: Per-form entity id used in the preview filename
+                   (default: entity-{entity_name.lower()})
+    """
     
     # Base fields for all entities
     base_fields = ["id", "name", "status", "createdDate", "updatedDate", "owner"]
@@ -303,10 +507,10 @@ def generate_preview_data_for_query(entity_name, query_id, estimated_results):
             "sample_values": {
                 "portfolioId": lambda: f"PF-{random.randint(100000, 999999)}",
                 "clientName": lambda: fake.name(),
-                "totalValue": lambda: round(random.uniform(100000, 15000000), 2),
-                "cashBalance": lambda: round(random.uniform(5000, 500000), 2),
-                "ytdReturn": lambda: round(random.uniform(-12.5, 28.5), 2),
-                "riskLevel": lambda: random.choice(["Conservative", "Moderate", "Aggressive", "Very Aggressive"]),
+                "totalValue": lambda: sample_field("totalValue"),
+                "cashBalance": lambda: sample_field("cashBalance"),
+                "ytdReturn": lambda: sample_field("ytdReturn"),
+                "riskLevel": lambda: sample_field("riskLevel"),
                 "advisor": lambda: fake.name()
             }
         },
@@ -318,8 +522,8 @@ def generate_preview_data_for_query(entity_name, query_id, estimated_results):
                 "lastName": lambda: fake.last_name(),
                 "email": lambda: fake.email(),
                 "phone": lambda: fake.phone_number(),
-                "aum": lambda: round(random.uniform(250000, 20000000), 2),
-                "riskTolerance": lambda: random.choice(["Conservative", "Moderate", "Aggressive"]),
+                "aum": lambda: sample_field("aum"),
+                "riskTolerance": lambda: sample_field("riskTolerance"),
                 "onboardDate": lambda: fake.date_between(start_date='-10y', end_date='now').isoformat()
             }
         },
@@ -327,10 +531,10 @@ def generate_preview_data_for_query(entity_name, query_id, estimated_results):
             "fields": ["accountNumber", "accountType", "currentValue", "costBasis", "unrealizedGain", "inceptionDate"],
             "sample_values": {
                 "accountNumber": lambda: f"{random.randint(1000000000, 9999999999)}",
-                "accountType": lambda: random.choice(["IRA", "Roth IRA", "401k", "Taxable", "Trust", "529 Plan"]),
-                "currentValue": lambda: round(random.uniform(50000, 5000000), 2),
-                "costBasis": lambda: round(random.uniform(40000, 4500000), 2),
-                "unrealizedGain": lambda: round(random.uniform(-50000, 800000), 2),
+                "accountType": lambda: sample_field("accountType"),
+                "currentValue": lambda: sample_field("currentValue"),
+                "costBasis": lambda: sample_field("costBasis"),
+                "unrealizedGain": lambda: sample_field("unrealizedGain"),
                 "inceptionDate": lambda: fake.date_between(start_date='-15y', end_date='-1y').isoformat()
             }
         },
@@ -338,10 +542,10 @@ def generate_preview_data_for_query(entity_name, query_id, estimated_results):
             "fields": ["tradeId", "symbol", "quantity", "price", "tradeType", "tradeDate", "settlementDate"],
             "sample_values": {
                 "tradeId": lambda: f"TRD-{random.randint(1000000, 9999999)}",
-                "symbol": lambda: random.choice(["AAPL", "MSFT", "GOOGL", "AMZN", "TSLA", "VTI", "SPY", "QQQ"]),
-                "quantity": lambda: random.randint(10, 1000),
-                "price": lambda: round(random.uniform(50, 500), 2),
-                "tradeType": lambda: random.choice(["Buy", "Sell", "Transfer In", "Transfer Out"]),
+                "symbol": lambda: sample_field("symbol"),
+                "quantity": lambda: sample_field("quantity"),
+                "price": lambda: sample_field("price"),
+                "tradeType": lambda: sample_field("tradeType"),
                 "tradeDate": lambda: fake.date_between(start_date='-30d', end_date='now').isoformat(),
                 "settlementDate": lambda: fake.date_between(start_date='now', end_date='+3d').isoformat()
             }
@@ -352,20 +556,20 @@ def generate_preview_data_for_query(entity_name, query_id, estimated_results):
                 "reportId": lambda: f"RPT-{random.randint(10000, 99999)}",
                 "periodStart": lambda: fake.date_between(start_date='-1y', end_date='-90d').isoformat(),
                 "periodEnd": lambda: fake.date_between(start_date='-89d', end_date='now').isoformat(),
-                "totalReturn": lambda: round(random.uniform(-8.5, 32.5), 2),
-                "benchmark": lambda: random.choice(["S&P 500", "MSCI World", "60/40 Portfolio", "Russell 2000"]),
-                "alpha": lambda: round(random.uniform(-3.0, 5.0), 2),
-                "sharpeRatio": lambda: round(random.uniform(0.5, 2.5), 2)
+                "totalReturn": lambda: sample_field("totalReturn"),
+                "benchmark": lambda: sample_field("benchmark"),
+                "alpha": lambda: sample_field("alpha"),
+                "sharpeRatio": lambda: sample_field("sharpeRatio")
             }
         },
         "RiskProfile": {
             "fields": ["profileId", "riskScore", "timeHorizon", "liquidityNeeds", "investmentExperience", "lastUpdated"],
             "sample_values": {
                 "profileId": lambda: f"RISK-{random.randint(10000, 99999)}",
-                "riskScore": lambda: random.randint(1, 100),
-                "timeHorizon": lambda: random.choice(["<3 years", "3-5 years", "5-10 years", "10+ years"]),
-                "liquidityNeeds": lambda: random.choice(["Low", "Medium", "High"]),
-                "investmentExperience": lambda: random.choice(["None", "Limited", "Moderate", "Extensive"]),
+                "riskScore": lambda: sample_field("riskScore"),
+                "timeHorizon": lambda: sample_field("timeHorizon"),
+                "liquidityNeeds": lambda: sample_field("liquidityNeeds"),
+                "investmentExperience": lambda: sample_field("investmentExperience"),
                 "lastUpdated": lambda: fake.date_between(start_date='-2y', end_date='now').isoformat()
             }
         }
@@ -378,34 +582,28 @@ def generate_preview_data_for_query(entity_name, query_id, estimated_results):
     else:
         entity_fields = ["type", "category", "value", "description"]
         sample_values = {
-            "type": lambda: random.choice(["Standard", "Premium", "Basic"]),
-            "category": lambda: random.choice(["Type A", "Type B", "Type C"]),
-            "value": lambda: round(random.uniform(100, 10000), 2),
+            "type": lambda: sample_field("type"),
+            "category": lambda: sample_field("category"),
+            "value": lambda: sample_field("value"),
             "description": lambda: fake.sentence(nb_words=6)
         }
     
-    # Generate records
+    # Generate records as row tuples (field order: base fields, then entity fields)
     num_records = min(estimated_results, 25)  # Limit preview to 25 records
-    records = []
+    value_makers = [sample_values.get(field, fake.word) for field in entity_fields]
+    records = RecordTable(base_fields + entity_fields)
     
     for i in range(num_records):
-        record = {
-            "id": str(uuid.uuid4()),
-            "name": f"{fake.catch_phrase()} {i+1}",
-            "status": random.choice(["Active", "Inactive", "Pending", "Completed"]),
-            "createdDate": fake.date_time_between(start_date='-1y', end_date='-1d').isoformat(),
-            "updatedDate": fake.date_time_between(start_date='-30d', end_date='now').isoformat(),
-            "owner": fake.name()
-        }
-        
-        # Add entity-specific fields
-        for field in entity_fields:
-            if field in sample_values:
-                record[field] = sample_values[field]()
-            else:
-                record[field] = fake.word()
-        
-        records.append(record)
+        records.rows.append((
+            str(uuid.UUID(int=random.getrandbits(128), version=4)),  # Seedable, unlike uuid4()
+            f"{fake.catch_phrase()} {i+1}",
+            sample_field("status"),
+            fake.date_time_between(start_date='-1y', end_date='-1d').isoformat(),
+            fake.date_time_between(start_date='-30d', end_date='now').isoformat(),
+            fake.name(),
+            # Add entity-specific fields
+            *[make_value() for make_value in value_makers]
+        ))
     
     # Generate field schema for frontend
     all_fields = base_fields + entity_fields
@@ -430,7 +628,7 @@ def generate_preview_data_for_query(entity_name, query_id, estimated_results):
         })
     
     return {
-        "entityId": f"entity-{entity_name.lower()}",
+        "entityId": entity_id or f"entity-{entity_name.lower()}",
         "queryId": query_id,
         "totalCount": estimated_results,
         "pageSize": 25,
@@ -439,29 +637,291 @@ def generate_preview_data_for_query(entity_name, query_id, estimated_results):
         "schema": schema
     }
 
-def generate_dependency_graph(form_summaries, target_entities=400, target_dashboards=250, target_processes=60, target_documents=50):
-    """Generate dependency graph showing relationships between entities, forms, documents, processes, and dashboards
+class PreviewBlobStore:
+    """Content-addressed storage for Call C preview payloads
+    
+    The per-query envelope (entityId, queryId, totalCount) goes into a routing
+    index; the rest of the payload (records, schema, paging) is hashed and
+    written once to blobs/{sha256}.json no matter how many queries share it.
+    """
+    
+    BODY_FIELDS = ("pageSize", "currentPage", "records", "schema")
+    
+    def __init__(self):
+        self.index = {}
+        self.known_hashes = set()
+        self.payloads = 0
+        self.logical_bytes = 0
+        self.stored_bytes = 0
+        os.makedirs(os.path.join(OUTPUT_DIR, "blobs"), exist_ok=True)
+    
+    def add(self, payload):
+        """Store one preview payload and return its content hash"""
+        body = {field: payload[field] for field in self.BODY_FIELDS}
+        data = json.dumps(body, indent=2, ensure_ascii=False, default=_json_default).encode('utf-8')
+        content_hash = hashlib.sha256(data).hexdigest()
+        
+        self.payloads += 1
+        self.logical_bytes += len(data)
+        if content_hash not in self.known_hashes:
+            self.known_hashes.add(content_hash)
+            self.stored_bytes += len(data)
+            with open(os.path.join(OUTPUT_DIR, "blobs", f"{content_hash}.json"), 'wb') as f:
+                f.write(data)
+        
+        self.index.setdefault(payload["entityId"], {})[payload["queryId"]] = {
+            "hash": content_hash,
+            "totalCount": payload["totalCount"]
+        }
+        return content_hash
+    
+    def save_index(self):
+        """Write preview-index.json and count it towards the stored bytes"""
+        save_json("preview-index.json", self.index)
+        self.stored_bytes += os.path.getsize(os.path.join(OUTPUT_DIR, "preview-index.json"))
+    
+    @property
+    def dedup_ratio(self):
+        return self.payloads / len(self.known_hashes) if self.known_hashes else 1.0
+
+def remove_stale_previews(dedup):
+    """Delete Call C files an earlier run left in OUTPUT_DIR in the other layout
+    
+    A --dedup run removes per-query preview-data-*.json files (the Angular app
+    would keep serving them) and old blobs; a per-query run removes
+    preview-index.json and blobs/, which the Python tools would otherwise prefer.
+    
+    Returns:
+        Number of files removed
+    """
+    removed = 0
+    blobs_dir = os.path.join(OUTPUT_DIR, "blobs")
+    with os.scandir(OUTPUT_DIR) as entries:
+        stale = [entry.path for entry in entries
+                 if entry.is_file() and (entry.name.startswith("preview-data-") if dedup else entry.name == "preview-index.json")]
+    if os.path.isdir(blobs_dir):
+        with os.scandir(blobs_dir) as entries:
+            stale.extend(entry.path for entry in entries if entry.is_file())
+    for path in stale:
+        os.remove(path)
+        removed += 1
+    if not dedup and os.path.isdir(blobs_dir):
+        os.rmdir(blobs_dir)
+    if removed:
+        print(f"[OK] Removed {removed} stale preview files from an earlier run")
+    return removed
+
+def seed_preview_payload(seed, entity_name, query_id, estimated_results):
+    """Reseed the value sources so a preview depends only on (entity, query, record count)"""
+    key = f"{seed}:{entity_name}:{query_id}:{min(estimated_results, 25)}"
+    random.seed(key)
+    if hasattr(fake, "seed_instance"):
+        fake.seed_instance(key)
+
+STATS_QUANTILES = (("p25", 0.25), ("p50", 0.50), ("p75", 0.75), ("p90", 0.90), ("p99", 0.99))
+STATS_HISTOGRAM_BINS = 10
+
+def compute_query_stats(records, total_count, rng):
+    """Compute facet counts and numeric aggregates over a query's full logical result set
+    
+    The preview rows are the first rows of the result set; the remaining
+    total_count - len(records) rows are drawn column-wise from the same field
+    distributions (rng.choices / one list per column). Each column is then
+    sorted once, and quantiles and histogram bins are read off by index/bisect.
     
     Args:
-        form_summaries: List of form/document summaries generated earlier
-        target_entities: Target number of unique entities (default: 400)
-        target_dashboards: Target number of dashboards (default: 250)
-        target_processes: Target number of processes (default: 60)
-        target_documents: Target number of standalone documents (default: 50)
+        records: RecordTable with the preview rows
+        total_count: Logical result size (query estimatedResults)
+        rng: random.Random for the extra rows, kept off the global stream so
+             --stats does not change previews or the graph for a given seed
     
     Returns:
-        Dictionary with nodes and links for dependency visualization
+        Dictionary with "facets" (value -> count) and "numeric" (count, min, max,
+        sum, mean, quantiles, histogram) per field
     """
-    nodes = []
-    links = []
+    remaining = max(0, total_count - len(records))
+    facets = {}
+    numeric = {}
+    
+    for field in records.fields:
+        if field in FACET_VALUES:
+            counts = Counter(records.column(field))
+            counts.update(rng.choices(FACET_VALUES[field], k=remaining))
+            facets[field] = {value: counts[value] for value in FACET_VALUES[field]}
+        elif field in NUMERIC_RANGES:
+            low, high, decimals = NUMERIC_RANGES[field]
+            if decimals is None:
+                drawn = rng.choices(range(low, high + 1), k=remaining)
+            else:
+                # Unrounded draws; only the reported aggregates are rounded
+                span = high - low
+                rand = rng.random
+                drawn = [low + span * rand() for _ in range(remaining)]
+            column = records.column(field) + drawn
+            if not column:
+                continue
+            column.sort()
+            
+            count = len(column)
+            total = sum(column)
+            col_min, col_max = column[0], column[-1]
+            width = (col_max - col_min) / STATS_HISTOGRAM_BINS
+            edges = [col_min + width * i for i in range(STATS_HISTOGRAM_BINS + 1)]
+            # Column is sorted, so bin counts are differences of insertion points
+            cuts = [0] + [bisect_left(column, edge) for edge in edges[1:-1]] + [count]
+            
+            numeric[field] = {
+                "count": count,
+                "min": round(col_min, 2),
+                "max": round(col_max, 2),
+                "sum": round(total, 2),
+                "mean": round(total / count, 2),
+                "quantiles": {label: round(column[min(count - 1, int(q * count))], 2) for label, q in STATS_QUANTILES},
+                "histogram": {
+                    "edges": [round(edge, 2) for edge in edges],
+                    "counts": [cuts[i + 1] - cuts[i] for i in range(STATS_HISTOGRAM_BINS)]
+                }
+            }
     
-    # Extract unique base entities from forms and create variations
+    return {"facets": facets, "numeric": numeric}
+
+# Node types in output order, with the id prefix each type uses ("e1", "f1", "d1", "p1", "dash1")
+NODE_TYPES = ["entity", "form", "document", "process", "dashboard"]
+NODE_ID_PREFIXES = ["e", "f", "d", "p", "dash"]
+ENTITY, FORM, DOCUMENT, PROCESS, DASHBOARD = range(len(NODE_TYPES))
+
+class CompactGraph:
+    """Dependency graph stored as parallel typed columns
+
+    Nodes and links are kept in `array` columns indexed by position, with
+    categories and relationship names interned to small integer codes. Node
+    ids ("e1", "dash7") are derived from type + ordinal, so no per-node or
+    per-link dicts exist until the graph is written out.
+    """
+
+    __slots__ = (
+        "node_names", "node_types", "node_ordinals", "node_categories", "type_counts",
+        "link_sources", "link_targets", "link_relationships", "link_strengths",
+        "categories", "category_codes", "relationships", "relationship_codes"
+    )
+
+    def __init__(self):
+        self.node_names = []
+        self.node_types = array('B')
+        self.node_ordinals = array('I')
+        self.node_categories = array('B')
+        self.type_counts = [0] * len(NODE_TYPES)
+        self.link_sources = array('I')
+        self.link_targets = array('I')
+        self.link_relationships = array('B')
+        self.link_strengths = array('d')
+        self.categories = []
+        self.category_codes = {}
+        self.relationships = []
+        self.relationship_codes = {}
+
+    @staticmethod
+    def _intern(table, codes, value):
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(table)
+            table.append(value)
+        return code
+
+    def add_node(self, node_type, name, category):
+        """Append a node and return its index
+
+        Args:
+            node_type: One of ENTITY, FORM, DOCUMENT, PROCESS, DASHBOARD
+            name: Display name
+            category: Category label (stored capitalized, interned)
+        """
+        self.type_counts[node_type] += 1
+        self.node_names.append(name)
+        self.node_types.append(node_type)
+        self.node_ordinals.append(self.type_counts[node_type])
+        self.node_categories.append(self._intern(self.categories, self.category_codes, category.capitalize()))
+        return len(self.node_names) - 1
+
+    def add_link(self, source, target, relationship, strength):
+        """Append a link between two node indexes"""
+        self.link_sources.append(source)
+        self.link_targets.append(target)
+        self.link_relationships.append(self._intern(self.relationships, self.relationship_codes, relationship))
+        self.link_strengths.append(strength)
+
+    @property
+    def node_count(self):
+        return len(self.node_names)
+
+    @property
+    def link_count(self):
+        return len(self.link_sources)
+
+    def node_id(self, index):
+        return f"{NODE_ID_PREFIXES[self.node_types[index]]}{self.node_ordinals[index]}"
+
+    def iter_nodes(self, node_ids=None):
+        """Yield nodes in the dependency-graph.json shape"""
+        for index, name in enumerate(self.node_names):
+            yield {
+                "id": node_ids[index] if node_ids else self.node_id(index),
+                "name": name,
+                "type": NODE_TYPES[self.node_types[index]],
+                "category": self.categories[self.node_categories[index]]
+            }
+
+    def iter_links(self, node_ids=None):
+        """Yield links in the dependency-graph.json shape"""
+        node_ids = node_ids or [self.node_id(i) for i in range(self.node_count)]
+        relationships = self.relationships
+        for source, target, relationship, strength in zip(
+                self.link_sources, self.link_targets, self.link_relationships, self.link_strengths):
+            yield {
+                "source": node_ids[source],
+                "target": node_ids[target],
+                "relationship": relationships[relationship],
+                "strength": strength
+            }
+
+    def to_dict(self):
+        """Materialize the full {"nodes": [...], "links": [...]} structure"""
+        node_ids = [self.node_id(i) for i in range(self.node_count)]
+        return {
+            "nodes": list(self.iter_nodes(node_ids)),
+            "links": list(self.iter_links(node_ids))
+        }
+
+    def write_json(self, f):
+        """Stream the graph as pretty-printed JSON, one node/link dict at a time
+
+        Produces the same bytes as json.dump(self.to_dict(), f, indent=2)
+        without holding every node and link dict in memory.
+        """
+        node_ids = [self.node_id(i) for i in range(self.node_count)]
+        for key, items, last in (("nodes", self.iter_nodes(node_ids), False),
+                                 ("links", self.iter_links(node_ids), True)):
+            f.write(('{\n' if key == "nodes" else '') + f'  "{key}": [')
+            separator = "\n    "
+            empty = True
+            for item in items:
+                f.write(separator + json.dumps(item, indent=2, ensure_ascii=False).replace("\n", "\n    "))
+                separator = ",\n    "
+                empty = False
+            f.write(("]" if empty else "\n  ]") + ("\n}" if last else ",\n"))
+
+def plan_entities(form_summaries, target_entities):
+    """Entity nodes for a graph, in creation order
+    
+    Each base entity (first-seen order in form_summaries) gets name variations
+    until target_entities is reached.
+    
+    Returns:
+        List of (full_name, base_name, category) tuples
+    """
     base_entities = {}
     for form in form_summaries:
-        entity_name = form["entityName"]
-        category = form["category"]
-        if entity_name not in base_entities:
-            base_entities[entity_name] = category
+        base_entities.setdefault(form["entityName"], form["category"])
     
     # Entity variations/suffixes to reach target count
     entity_variations = [
@@ -470,90 +930,77 @@ def generate_dependency_graph(form_summaries, target_entities=400, target_dashbo
         " - US", " - EU", " - APAC", " - Global", " - Regional", " - Local",
         " - Legacy", " - Modern", " - V1", " - V2", " - V3", " - Beta", " - Production"
     ]
-    
-    # Create entity nodes with variations to reach target
-    entity_id_map = {}
-    entity_count = 0
     variations_needed = max(1, (target_entities // len(base_entities)) + 1)
     
+    plan = []
     for base_name, category in base_entities.items():
-        for i, variation in enumerate(entity_variations[:variations_needed]):
-            if entity_count >= target_entities:
-                break
-            entity_count += 1
-            entity_id = f"e{entity_count}"
-            full_name = f"{base_name}{variation}" if variation else base_name
-            entity_id_map[full_name] = entity_id
-            # Also map base name for lookups
-            if not variation:
-                entity_id_map[base_name] = entity_id
-            
-            nodes.append({
-                "id": entity_id,
-                "name": full_name,
-                "type": "entity",
-                "category": category.capitalize()
-            })
-        if entity_count >= target_entities:
-            break
+        for variation in entity_variations[:variations_needed]:
+            if len(plan) >= target_entities:
+                return plan
+            plan.append((f"{base_name}{variation}" if variation else base_name, base_name, category))
+    return plan
+
+def generate_dependency_graph(form_summaries, target_entities=400, target_dashboards=250, target_processes=60, target_documents=50, number_offset=0,
+                              entity_plan=None):
+    """Generate dependency graph showing relationships between entities, forms, documents, processes, and dashboards
+    
+    Args:
+        form_summaries: List of form/document summaries generated earlier
+        target_entities: Target number of unique entities (default: 400)
+        target_dashboards: Target number of dashboards (default: 250)
+        target_processes: Target number of processes (default: 60)
+        target_documents: Target number of standalone documents (default: 50)
+        number_offset: Added to the "#n" in generated document/process/dashboard
+                       names so partition slices don't repeat names
+        entity_plan: Entity nodes to create, as returned by plan_entities()
+                     (default: plan_entities(form_summaries, target_entities))
+    
+    Returns:
+        CompactGraph with nodes and links for dependency visualization
+    """
+    graph = CompactGraph()
+    
+    # Create entity nodes (base entities plus variations) to reach target
+    if entity_plan is None:
+        entity_plan = plan_entities(form_summaries, target_entities)
+    entity_id_map = {}
+    # entity_id_map values in insertion order, built once instead of per sample
+    entity_pool = []
+    for full_name, base_name, category in entity_plan:
+        entity_index = graph.add_node(ENTITY, full_name, category)
+        entity_id_map[full_name] = entity_index
+        entity_pool.append(entity_index)
     
     # Create form/document nodes from summaries and link them to entities
-    form_nodes = []
-    doc_nodes = []
+    doc_indexes = []
     
-    for idx, form in enumerate(form_summaries, 1):
-        item_type = form["type"]
-        entity_name = form["entityName"]
-        entity_id = entity_id_map.get(entity_name)
+    for form in form_summaries:
+        entity_index = entity_id_map.get(form["entityName"])
         
-        if item_type == "Form":
-            node_id = f"f{len(form_nodes) + 1}"
-            form_nodes.append({
-                "id": node_id,
-                "name": form["name"],
-                "type": "form",
-                "category": form["category"].capitalize()
-            })
+        if form["type"] == "Form":
+            node_index = graph.add_node(FORM, form["name"], form["category"])
             
             # Link form to entity (form creates entity)
-            if entity_id:
-                links.append({
-                    "source": node_id,
-                    "target": entity_id,
-                    "relationship": "creates",
-                    "strength": 1.0
-                })
+            if entity_index is not None:
+                graph.add_link(node_index, entity_index, "creates", 1.0)
                 
                 # Randomly link to 1-2 additional related entities
                 if len(entity_id_map) > 10 and random.random() > 0.7:
-                    related_entity_id = random.choice(list(entity_id_map.values()))
-                    if related_entity_id != entity_id:
-                        links.append({
-                            "source": node_id,
-                            "target": related_entity_id,
-                            "relationship": random.choice(["requires", "references", "updates"]),
-                            "strength": random.uniform(0.5, 0.8)
-                        })
+                    related_index = random.choice(entity_pool)
+                    if related_index != entity_index:
+                        graph.add_link(
+                            node_index,
+                            related_index,
+                            random.choice(["requires", "references", "updates"]),
+                            random.uniform(0.5, 0.8)
+                        )
         else:  # Document
-            node_id = f"d{len(doc_nodes) + 1}"
-            doc_nodes.append({
-                "id": node_id,
-                "name": form["name"],
-                "type": "document",
-                "category": form["category"].capitalize()
-            })
+            node_index = graph.add_node(DOCUMENT, form["name"], form["category"])
+            doc_indexes.append(node_index)
             
             # Link document to entity (document displays/reports entity)
-            if entity_id:
-                links.append({
-                    "source": node_id,
-                    "target": entity_id,
-                    "relationship": "displays",
-                    "strength": 0.9
-                })
-    
-    nodes.extend(form_nodes)
-    nodes.extend(doc_nodes)
+            if entity_index is not None:
+                graph.add_link(node_index, entity_index, "displays", 0.9)
     
     # Generate additional standalone documents to reach target
     doc_templates = [
@@ -565,27 +1012,21 @@ def generate_dependency_graph(form_summaries, target_entities=400, target_dashbo
         ("Annual Report", "reporting"), ("Performance Summary", "reporting")
     ]
     
-    additional_docs_needed = max(0, target_documents - len(doc_nodes))
+    additional_docs_needed = max(0, target_documents - len(doc_indexes))
     for i in range(additional_docs_needed):
         doc_template, doc_category = random.choice(doc_templates)
-        doc_id = f"d{len(doc_nodes) + 1}"
-        doc_nodes.append({
-            "id": doc_id,
-            "name": f"{doc_template} #{i+1}",
-            "type": "document",
-            "category": doc_category.capitalize()
-        })
+        doc_index = graph.add_node(DOCUMENT, f"{doc_template} #{number_offset + i + 1}", doc_category)
+        doc_indexes.append(doc_index)
         
         # Link to 1-3 random entities
         num_links = random.randint(1, 3)
-        linked_entities = random.sample(list(entity_id_map.values()), min(num_links, len(entity_id_map)))
-        for entity_id in linked_entities:
-            links.append({
-                "source": doc_id,
-                "target": entity_id,
-                "relationship": random.choice(["documents", "reports", "analyzes"]),
-                "strength": random.uniform(0.7, 0.95)
-            })
+        for entity_index in random.sample(entity_pool, min(num_links, len(entity_pool))):
+            graph.add_link(
+                doc_index,
+                entity_index,
+                random.choice(["documents", "reports", "analyzes"]),
+                random.uniform(0.7, 0.95)
+            )
     
     # Generate process nodes to reach target
     process_templates = [
@@ -598,27 +1039,18 @@ def generate_dependency_graph(form_summaries, target_entities=400, target_dashbo
     ]
     
     for i in range(target_processes):
-        proc_id = f"p{i+1}"
         proc_template, proc_category = random.choice(process_templates)
-        proc_name = f"{proc_template} Process #{i+1}"
-        
-        nodes.append({
-            "id": proc_id,
-            "name": proc_name,
-            "type": "process",
-            "category": proc_category.capitalize()
-        })
+        proc_index = graph.add_node(PROCESS, f"{proc_template} Process #{number_offset + i + 1}", proc_category)
         
         # Link processes to 2-5 related entities
         num_links = random.randint(2, 5)
-        linked_entities = random.sample(list(entity_id_map.values()), min(num_links, len(entity_id_map)))
-        for entity_id in linked_entities:
-            links.append({
-                "source": proc_id,
-                "target": entity_id,
-                "relationship": random.choice(["manages", "processes", "validates", "transforms"]),
-                "strength": random.uniform(0.7, 0.95)
-            })
+        for entity_index in random.sample(entity_pool, min(num_links, len(entity_pool))):
+            graph.add_link(
+                proc_index,
+                entity_index,
+                random.choice(["manages", "processes", "validates", "transforms"]),
+                random.uniform(0.7, 0.95)
+            )
     
     # Generate dashboard nodes to reach target
     dashboard_templates = [
@@ -629,66 +1061,412 @@ def generate_dependency_graph(form_summaries, target_entities=400, target_dashbo
     ]
     
     for i in range(target_dashboards):
-        dash_id = f"dash{i+1}"
         dash_template, dash_category = random.choice(dashboard_templates)
-        dash_name = f"{dash_template} Dashboard #{i+1}"
-        
-        nodes.append({
-            "id": dash_id,
-            "name": dash_name,
-            "type": "dashboard",
-            "category": dash_category.capitalize()
-        })
+        dash_index = graph.add_node(DASHBOARD, f"{dash_template} Dashboard #{number_offset + i + 1}", dash_category)
         
         # Link dashboards to 3-8 entities they display
         num_links = random.randint(3, 8)
-        linked_entities = random.sample(list(entity_id_map.values()), min(num_links, len(entity_id_map)))
-        for entity_id in linked_entities:
-            links.append({
-                "source": dash_id,
-                "target": entity_id,
-                "relationship": random.choice(["queries", "displays", "monitors", "aggregates"]),
-                "strength": random.uniform(0.85, 1.0)
-            })
+        for entity_index in random.sample(entity_pool, min(num_links, len(entity_pool))):
+            graph.add_link(
+                dash_index,
+                entity_index,
+                random.choice(["queries", "displays", "monitors", "aggregates"]),
+                random.uniform(0.85, 1.0)
+            )
         
         # Link dashboards to some documents
-        if doc_nodes and random.random() > 0.6:
+        if doc_indexes and random.random() > 0.6:
             num_doc_links = random.randint(1, 3)
-            linked_docs = random.sample([d["id"] for d in doc_nodes], min(num_doc_links, len(doc_nodes)))
-            for doc_id in linked_docs:
-                links.append({
-                    "source": dash_id,
-                    "target": doc_id,
-                    "relationship": "generates",
-                    "strength": random.uniform(0.6, 0.85)
-                })
+            for doc_index in random.sample(doc_indexes, min(num_doc_links, len(doc_indexes))):
+                graph.add_link(dash_index, doc_index, "generates", random.uniform(0.6, 0.85))
     
     # Add entity-to-entity relationships (10-20% of entities)
-    entity_ids = list(entity_id_map.values())
     relationship_types = ["contains", "belongs_to", "relates_to", "depends_on", "aggregates", "derives_from"]
-    num_entity_relationships = int(len(entity_ids) * 0.15)
+    num_entity_relationships = int(len(entity_pool) * 0.15)
     
     for _ in range(num_entity_relationships):
-        if len(entity_ids) >= 2:
-            source_id, target_id = random.sample(entity_ids, 2)
-            links.append({
-                "source": source_id,
-                "target": target_id,
-                "relationship": random.choice(relationship_types),
-                "strength": random.uniform(0.6, 0.95)
-            })
+        if len(entity_pool) >= 2:
+            source_index, target_index = random.sample(entity_pool, 2)
+            graph.add_link(
+                source_index,
+                target_index,
+                random.choice(relationship_types),
+                random.uniform(0.6, 0.95)
+            )
     
-    return {
-        "nodes": nodes,
-        "links": links
+    return graph
+
+def benchmark_graph_memory(target_links=1_000_000):
+    """Compare peak memory of the compact graph against per-node/per-link dicts
+
+    Builds a graph of roughly `target_links` links (dashboard-heavy, like scale
+    mode) and measures tracemalloc peaks for the CompactGraph build and for
+    materializing the equivalent {"nodes": [...], "links": [...]} dicts.
+    """
+    import tracemalloc
+    
+    print(f"\n*** Dependency Graph Memory Benchmark [~{target_links:,} links] ***")
+    print("=" * 70)
+    form_summaries = generate_realistic_forms()
+    # Dashboards average ~6.3 links (5.5 entities + 0.8 documents); forms/docs/processes add the rest
+    target_dashboards = max(1, (target_links - len(form_summaries) * 2) * 10 // 63)
+    
+    tracemalloc.start()
+    graph = generate_dependency_graph(
+        form_summaries,
+        target_entities=5000,
+        target_dashboards=target_dashboards,
+        target_processes=2000,
+        target_documents=2000
+    )
+    _, compact_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    tracemalloc.start()
+    graph_dict = graph.to_dict()
+    _, dict_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del graph_dict
+    
+    mb = 1024 * 1024
+    print(f"  * Nodes / Links:       {graph.node_count:,} / {graph.link_count:,}")
+    print(f"  * Compact Peak:        {compact_peak / mb:.1f} MB")
+    print(f"  * Dict Model Peak:     {dict_peak / mb:.1f} MB")
+    print(f"  * Reduction:           {dict_peak / compact_peak:.1f}x")
+    print("\n")
+
+def generate_change_feed(form_metadata, preview_index, ticks, change_fraction=0.05,
+                         record_change_fraction=0.02, tick_seconds=3600, start_time=None):
+    """Generate incremental change batches over simulated time
+
+    Each tick advances the simulated clock, mutates a random fraction of queries
+    (estimatedResults, lastRun) and preview records (status, updatedDate), and
+    writes changes/delta-{tick:04d}.json. The flat indexes are built once, so
+    a tick costs O(changed items), not O(dataset).
+
+    Args:
+        form_metadata: Metadata dict written as form-metadata.json (mutated in place)
+        preview_index: List of [entityId, queryId, formId, queryIndex, recordIds] per preview file
+        ticks: Number of ticks to simulate
+        change_fraction: Fraction of queries mutated per tick
+        record_change_fraction: Fraction of preview records mutated per tick
+        tick_seconds: Simulated seconds between ticks
+        start_time: Simulated clock at tick 0 (default: now)
+
+    Returns:
+        Manifest dict (also written as changes/manifest.json)
+    """
+    os.makedirs(os.path.join(OUTPUT_DIR, "changes"), exist_ok=True)
+
+    # Flat indexes (built once): query slot -> preview, and cumulative record counts
+    query_slots = [(form_id, qi) for form_id, metadata in form_metadata.items()
+                   for qi in range(len(metadata["queries"]))]
+    preview_by_slot = {(entry[2], entry[3]): entry for entry in preview_index}
+    record_slots = [(pi, ri) for pi, entry in enumerate(preview_index) for ri in range(len(entry[4]))]
+
+    sim_time = (start_time or datetime.now()).replace(microsecond=0)
+    version = {"metadata": 0, "preview": 0}
+    manifest = {
+        "baseVersion": dict(version),
+        "startTime": sim_time.isoformat(),
+        "tickSeconds": tick_seconds,
+        "deltas": []
     }
+    statuses = FACET_VALUES["status"]
+    total_query_changes = 0
+    total_record_changes = 0
+
+    for tick in range(1, ticks + 1):
+        sim_time += timedelta(seconds=tick_seconds)
+        now_iso = sim_time.isoformat()
+        base_version = dict(version)
+
+        num_queries = min(len(query_slots), int(len(query_slots) * change_fraction))
+        num_records = min(len(record_slots), int(len(record_slots) * record_change_fraction))
+
+        query_patches = []
+        preview_patches = []
+        touched_forms = set()
+        for form_id, qi in random.sample(query_slots, num_queries):
+            metadata = form_metadata[form_id]
+            query = metadata["queries"][qi]
+            old_results = query["estimatedResults"]
+            new_results = max(1, int(old_results * random.uniform(0.9, 1.15)))
+            query["estimatedResults"] = new_results
+            query["lastRun"] = now_iso
+            query_patches.append({
+                "formId": form_id,
+                "queryId": query["id"],
+                "set": {"estimatedResults": new_results, "lastRun": now_iso}
+            })
+            touched_forms.add(form_id)
+
+            entry = preview_by_slot.get((form_id, qi))
+            if entry:
+                preview_patches.append({
+                    "entityId": entry[0],
+                    "queryId": entry[1],
+                    "set": {"totalCount": new_results}
+                })
+
+        form_patches = []
+        for form_id in sorted(touched_forms):
+            metadata = form_metadata[form_id]
+            # Same rule as generate_form_metadata; a form has at most 7 queries, so this stays O(changed)
+            metadata["totalRecords"] = sum(q["estimatedResults"] for q in metadata["queries"]) // 2
+            metadata["lastUpdated"] = now_iso
+            form_patches.append({
+                "formId": form_id,
+                "set": {"totalRecords": metadata["totalRecords"], "lastUpdated": now_iso}
+            })
+
+        for pi, ri in random.sample(record_slots, num_records):
+            entry = preview_index[pi]
+            preview_patches.append({
+                "entityId": entry[0],
+                "queryId": entry[1],
+                "recordId": entry[4][ri],
+                "set": {"status": random.choice(statuses), "updatedDate": now_iso}
+            })
+
+        if query_patches or form_patches:
+            version["metadata"] += 1
+        if preview_patches:
+            version["preview"] += 1
+
+        delta_file = f"changes/delta-{tick:04d}.json"
+        save_json(delta_file, {
+            "tick": tick,
+            "timestamp": now_iso,
+            "baseVersion": base_version,
+            "version": dict(version),
+            "metadata": {"forms": form_patches, "queries": query_patches},
+            "preview": preview_patches
+        }, compact=True, quiet=True)
+        manifest["deltas"].append({
+            "tick": tick,
+            "file": delta_file,
+            "timestamp": now_iso,
+            "version": dict(version),
+            "queryChanges": len(query_patches),
+            "previewChanges": len(preview_patches)
+        })
+        total_query_changes += len(query_patches)
+        total_record_changes += num_records
+
+    manifest["version"] = dict(version)
+    save_json("changes/manifest.json", manifest)
+    print(f"[OK] Generated {ticks} delta files ({total_query_changes} query changes, {total_record_changes} record changes)")
+    return manifest
+
+def parse_partition(value):
+    """Parse a 'K/N' partition spec (1 <= K <= N) into (K, N)"""
+    try:
+        partition, num_partitions = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected K/N, got {value!r}")
+    if not 1 <= partition <= num_partitions:
+        raise argparse.ArgumentTypeError(f"K must be between 1 and N, got {value!r}")
+    return partition, num_partitions
+
+def parse_anchor_date(value):
+    """Parse a YYYY-MM-DD --anchor-date into a midnight datetime"""
+    try:
+        return datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected YYYY-MM-DD, got {value!r}")
+
+def partition_dir(partition, num_partitions):
+    """Relative directory for one partition slice"""
+    return os.path.join("partitions", f"part-{partition}-of-{num_partitions}")
+
+def select_partition(form_summaries, partition, num_partitions):
+    """Return the forms belonging to one partition slice
+    
+    Forms are stably ordered by category and cut into N contiguous slices of
+    equal size, so each slice covers one or a few categories (a category can
+    straddle two slices) and the union of all slices is every form exactly once.
+    """
+    ordered = sorted(form_summaries, key=lambda form: form["category"])
+    start = (partition - 1) * len(ordered) // num_partitions
+    end = partition * len(ordered) // num_partitions
+    return ordered[start:end]
+
+def partition_entity_plan(all_form_summaries, partition, num_partitions, target_entities):
+    """Entity nodes one slice creates, taken from the unpartitioned entity plan
+    
+    Each base entity (with all its variations) belongs to the first slice that
+    contains one of its forms. Other slices whose forms use it only add the
+    base node so their "creates" links resolve; the merge collapses those by
+    name, so the merged graph has exactly the entities of an unpartitioned run.
+    """
+    owners = {}
+    for slice_index in range(1, num_partitions + 1):
+        for form in select_partition(all_form_summaries, slice_index, num_partitions):
+            owners.setdefault(form["entityName"], slice_index)
+    referenced = {form["entityName"] for form in select_partition(all_form_summaries, partition, num_partitions)}
+    return [
+        (full_name, base_name, category)
+        for full_name, base_name, category in plan_entities(all_form_summaries, target_entities)
+        if owners[base_name] == partition or (full_name == base_name and base_name in referenced)
+    ]
 
-def generate_three_call_mock_data(mode='full'):
+def merge_partitions(num_partitions, seed=0):
+    """Stitch N partition slices into the top-level Four-Call files
+    
+    Concatenates summaries, unions metadata, moves preview files (or blobs and
+    preview-index.json for --dedup slices) up from the slice directories, and rebuilds one dependency graph: node ids are
+    renumbered, entities with the same name are merged, and cross-partition
+    entity-to-entity links are added (seeded, so the merge is deterministic).
+    Also writes partition-index.json (formId -> partition).
+    
+    All slices are checked before anything is moved, so a missing slice or
+    file leaves every slice directory untouched.
+    
+    Args:
+        num_partitions: N used when generating the slices
+        seed: Seed used for the cross-partition links
+    
+    Raises:
+        FileNotFoundError: If a slice directory or one of its required files is missing
+    """
+    print(f"\n*** SPX Magic Selector - Merging {num_partitions} Partitions ***")
+    print("=" * 70)
+    
+    missing = []
+    for partition in range(1, num_partitions + 1):
+        part_path = os.path.join(BASE_DIR, partition_dir(partition, num_partitions))
+        if not os.path.isdir(part_path):
+            missing.append(part_path)
+            continue
+        required = ["form-summaries.json", "form-metadata.json", "dependency-graph.json"]
+        if os.path.exists(os.path.join(part_path, "preview-index.json")):
+            required.append("blobs")
+        missing.extend(os.path.join(part_path, name) for name in required
+                       if not os.path.exists(os.path.join(part_path, name)))
+    if missing:
+        raise FileNotFoundError(f"Cannot merge {num_partitions} partitions, nothing was moved. Missing: {', '.join(missing)}")
+    remove_stale_previews(dedup=any(
+        os.path.exists(os.path.join(BASE_DIR, partition_dir(partition, num_partitions), "preview-index.json"))
+        for partition in range(1, num_partitions + 1)
+    ))
+    
+    def load_part(partition, filename):
+        filepath = os.path.join(BASE_DIR, partition_dir(partition, num_partitions), filename)
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    form_summaries = []
+    form_metadata = {}
+    partition_index = {}
+    graph = CompactGraph()
+    entity_by_name = {}
+    entity_partitions = []
+    preview_files_moved = 0
+    preview_routes = {}
+    
+    for partition in range(1, num_partitions + 1):
+        part_path = os.path.join(BASE_DIR, partition_dir(partition, num_partitions))
+        
+        summaries = load_part(partition, "form-summaries.json")
+        form_summaries.extend(summaries)
+        form_metadata.update(load_part(partition, "form-metadata.json"))
+        for summary in summaries:
+            partition_index[summary["id"]] = partition
+        
+        # Renumber graph nodes; entities shared between slices collapse into one node
+        part_graph = load_part(partition, "dependency-graph.json")
+        local_index = {}
+        for node in part_graph["nodes"]:
+            node_type = NODE_TYPES.index(node["type"])
+            if node_type == ENTITY and node["name"] in entity_by_name:
+                local_index[node["id"]] = entity_by_name[node["name"]]
+                continue
+            index = graph.add_node(node_type, node["name"], node["category"])
+            local_index[node["id"]] = index
+            if node_type == ENTITY:
+                entity_by_name[node["name"]] = index
+                entity_partitions.append((index, partition))
+        for link in part_graph["links"]:
+            graph.add_link(local_index[link["source"]], local_index[link["target"]], link["relationship"], link["strength"])
+        
+        # Preview filenames are globally unique (per-form entityId), so a rename is enough
+        with os.scandir(part_path) as entries:
+            for entry in entries:
+                if entry.name.startswith(("preview-data-", "stats-")):
+                    os.replace(entry.path, os.path.join(BASE_DIR, entry.name))
+                    preview_files_moved += entry.name.startswith("preview-data-")
+        
+        # Deduplicated slices: blobs are content-addressed, so same name means same bytes
+        if os.path.exists(os.path.join(part_path, "preview-index.json")):
+            for entity_id, queries in load_part(partition, "preview-index.json").items():
+                preview_routes.setdefault(entity_id, {}).update(queries)
+            os.makedirs(os.path.join(BASE_DIR, "blobs"), exist_ok=True)
+            with os.scandir(os.path.join(part_path, "blobs")) as entries:
+                for entry in entries:
+                    os.replace(entry.path, os.path.join(BASE_DIR, "blobs", entry.name))
+        print(f"[OK] Merged partition {partition}/{num_partitions} ({len(summaries)} forms)")
+    
+    # Cross-partition entity links, at the same density as in-slice entity relationships
+    rng = random.Random(f"{seed}:merge:{num_partitions}")
+    relationship_types = ["contains", "belongs_to", "relates_to", "depends_on", "aggregates", "derives_from"]
+    num_cross_links = int(len(entity_partitions) * 0.15 * (num_partitions - 1) / num_partitions)
+    cross_links = 0
+    if len({partition for _, partition in entity_partitions}) > 1:
+        while cross_links < num_cross_links:
+            (source_index, source_part), (target_index, target_part) = rng.sample(entity_partitions, 2)
+            if source_part != target_part:
+                graph.add_link(source_index, target_index, rng.choice(relationship_types), rng.uniform(0.6, 0.95))
+                cross_links += 1
+    
+    print()
+    save_json("form-summaries.json", form_summaries)
+    save_json("form-metadata.json", form_metadata)
+    save_json("dependency-graph.json", graph)
+    save_json("partition-index.json", partition_index)
+    if preview_routes:
+        save_json("preview-index.json", preview_routes)
+    
+    print("\n" + "=" * 70)
+    print(f"[SUCCESS] Merged {num_partitions} partitions into {BASE_DIR}")
+    print(f"  * Business Forms:      {len(form_summaries)}")
+    print(f"  * Preview Data Files:  {preview_files_moved} moved")
+    print(f"  * Graph:               {graph.node_count} nodes, {graph.link_count} links ({cross_links} cross-partition)")
+    print("\n")
+
+def generate_three_call_mock_data(mode='full', ticks=0, change_fraction=0.05, record_change_fraction=0.02, tick_seconds=3600, backend='auto',
+                                  partition=None, seed=None, dedup=False, stats=False, anchor_date=None):
     """Main function to generate Four-Call API mock data
     
     Args:
         mode: 'light' for Netlify (24 forms), 'full' for local (408 forms), 'scale' for performance test (1300 forms)
+        ticks: Number of change-feed ticks to generate after the snapshot (0 = none)
+        change_fraction: Fraction of queries mutated per tick
+        record_change_fraction: Fraction of preview records mutated per tick
+        tick_seconds: Simulated seconds between ticks
+        backend: 'tables', 'faker', or 'auto' (tables for light mode, faker otherwise)
+        partition: Optional (K, N) to generate only slice K of N into partitions/part-K-of-N/
+        seed: Random seed (partition slices and dedup runs default to 0 so they are deterministic)
+        dedup: Store preview payloads content-addressed under blobs/ with preview-index.json
+        stats: Also write stats-{entityId}-{queryId}.json (facets + numeric aggregates) per query
+        anchor_date: Datetime that relative dates resolve against (seeded runs default
+                     to SEEDED_ANCHOR, unseeded runs to the wall clock)
     """
+    global OUTPUT_DIR
+    run_started = time.perf_counter()
+    if (partition or dedup) and seed is None:
+        seed = 0
+    if seed is not None:
+        # Each slice gets its own stream so slices can be generated independently
+        random.seed(f"{seed}:{partition[0]}/{partition[1]}" if partition else seed)
+    if backend == 'auto':
+        backend = 'tables' if mode == 'light' else 'faker'
+    anchor = anchor_date or (SEEDED_ANCHOR if seed is not None else None)
+    backend_seconds = set_fake_backend(backend, seed=None if seed is None else random.getrandbits(32), anchor=anchor)
+    if partition:
+        OUTPUT_DIR = os.path.join(BASE_DIR, partition_dir(*partition))
+        os.makedirs(OUTPUT_DIR, exist_ok=True)
+    
     if mode == 'light':
         form_limit = 24
         mode_label = "LIGHT (Netlify)"
@@ -700,12 +1478,16 @@ def generate_three_call_mock_data(mode='full'):
         form_limit = None
         mode_label = "FULL (Local Development)"
     
-    print(f"\n*** SPX Magic Selector - Four-Call API Mock Data Generator [{mode_label}] ***")
+    if partition:
+        mode_label += f", PARTITION {partition[0]}/{partition[1]}"
+    print(f"\n*** SPX Magic Selector - Four-Call API Mock Data Generator [{mode_label}, {backend} backend] ***")
     print("=" * 70)
     
     # Call A: Generate form summaries (lightweight dropdown data)
     print("\n[1/4] Call A: Generating Form Summaries...")
-    form_summaries = generate_realistic_forms(limit=form_limit)
+    form_summaries = all_form_summaries = generate_realistic_forms(limit=form_limit)
+    if partition:
+        form_summaries = select_partition(all_form_summaries, *partition)
     save_json("form-summaries.json", form_summaries)
     
     # Call B: Generate form metadata (queries and details per form)
@@ -716,22 +1498,53 @@ def generate_three_call_mock_data(mode='full'):
     # Call C: Generate preview data for each query
     print("\n[3/4] Call C: Generating Preview Data Files...")
     preview_files_created = 0
+    preview_index = []
+    remove_stale_previews(dedup)
+    blob_store = PreviewBlobStore() if dedup else None
+    stats_files_created = 0
     
     for form_id, metadata in form_metadata.items():
         entity_name = metadata["entityName"]
         entity_id = metadata["entityId"]
         
-        for query in metadata["queries"]:
+        for query_index, query in enumerate(metadata["queries"]):
             query_id = query["id"]
             estimated_results = query["estimatedResults"]
             
             # Generate preview data for this specific entity/query combination
-            preview_data = generate_preview_data_for_query(entity_name, query_id, estimated_results)
+            if blob_store:
+                random_state = random.getstate()
+                seed_preview_payload(seed or 0, entity_name, query_id, estimated_results)
+            preview_data = generate_preview_data_for_query(entity_name, query_id, estimated_results, entity_id=entity_id)
             
-            # Save as individual file per query (realistic API pattern)
-            filename = f"preview-data-{entity_id}-{query_id}.json"
-            save_json(filename, preview_data)
+            if blob_store:
+                random.setstate(random_state)
+                blob_store.add(preview_data)
+            else:
+                # Save as individual file per query (realistic API pattern)
+                filename = f"preview-data-{entity_id}-{query_id}.json"
+                save_json(filename, preview_data)
             preview_files_created += 1
+            
+            if stats:
+                stats_rng = random.Random(f"{seed}:{entity_id}:{query_id}") if seed is not None else random.Random()
+                save_json(f"stats-{entity_id}-{query_id}.json", {
+                    "entityId": entity_id,
+                    "queryId": query_id,
+                    "totalCount": estimated_results,
+                    **compute_query_stats(preview_data["records"], estimated_results, stats_rng)
+                }, quiet=True)
+                stats_files_created += 1
+            
+            if ticks:
+                preview_index.append([entity_id, query_id, form_id, query_index,
+                                      preview_data["records"].column("id")])
+    
+    if stats:
+        print(f"[OK] Generated {stats_files_created} stats-*.json files")
+    if blob_store:
+        blob_store.save_index()
+        print(f"[OK] Stored {blob_store.payloads} previews as {len(blob_store.known_hashes)} blobs")
     
     # Generate dependency graph with realistic enterprise scale
     print("\n[4/4] Generating Dependency Graph...")
@@ -750,56 +1563,94 @@ def generate_three_call_mock_data(mode='full'):
         target_processes = 60
         target_dashboards = 250
     else:  # full
-        target_entities = len(set(f["entityName"] for f in form_summaries))
+        target_entities = len(set(f["entityName"] for f in all_form_summaries))
         target_forms = min(len(form_summaries), 1032)
         target_documents = 250
         target_processes = 50
         target_dashboards = 40
     
+    number_offset = 0
+    entity_plan = None
+    if partition:
+        # Each slice builds its share of the graph so the merged counts match an
+        # unpartitioned run; the merge step renumbers ids
+        index, num_partitions = partition
+        entity_plan = partition_entity_plan(all_form_summaries, index, num_partitions, target_entities)
+        # Standalone documents only top up the Document forms, so split the global top-up
+        count_documents = lambda forms: sum(1 for form in forms if form["type"] != "Form")
+        standalone_documents = max(0, target_documents - count_documents(all_form_summaries))
+        number_offset = (index - 1) * max(-(-target // num_partitions)
+                                          for target in (standalone_documents, target_processes, target_dashboards))
+        per_slice = lambda target: index * target // num_partitions - (index - 1) * target // num_partitions
+        target_documents = count_documents(form_summaries) + per_slice(standalone_documents)
+        target_processes = per_slice(target_processes)
+        target_dashboards = per_slice(target_dashboards)
+    
     dependency_graph = generate_dependency_graph(
         form_summaries,
         target_entities=target_entities,
         target_dashboards=target_dashboards,
         target_processes=target_processes,
-        target_documents=target_documents
+        target_documents=target_documents,
+        number_offset=number_offset,
+        entity_plan=entity_plan
     )
     save_json("dependency-graph.json", dependency_graph)
     
+    # Optional change feed: incremental update batches over simulated time
+    change_manifest = None
+    if ticks:
+        print(f"\n[+] Generating Change Feed ({ticks} ticks)...")
+        change_manifest = generate_change_feed(
+            form_metadata,
+            preview_index,
+            ticks,
+            change_fraction=change_fraction,
+            record_change_fraction=record_change_fraction,
+            tick_seconds=tick_seconds,
+            start_time=anchor
+        )
+    
     # Count node types
-    node_counts = {
-        "entity": 0,
-        "form": 0,
-        "document": 0,
-        "process": 0,
-        "dashboard": 0
-    }
-    for node in dependency_graph['nodes']:
-        node_type = node['type']
-        if node_type in node_counts:
-            node_counts[node_type] += 1
+    node_counts = dict(zip(NODE_TYPES, dependency_graph.type_counts))
     
     # Summary
     print("\n" + "=" * 70)
-    print(f"[SUCCESS] Four-Call API mock data generated in {BASE_DIR}")
+    print(f"[SUCCESS] Four-Call API mock data generated in {OUTPUT_DIR}")
     print("\n>> Production-Ready API Pattern:")
     print(f"  Call A (Dropdown):     form-summaries.json ({len(form_summaries)} forms)")
     print(f"  Call B (Metadata):     form-metadata.json ({len(form_metadata)} forms)")
-    print(f"  Call C (Preview):      {preview_files_created} preview-data-*.json files")
-    print(f"  Call D (Dependencies): dependency-graph.json ({len(dependency_graph['nodes'])} nodes, {len(dependency_graph['links'])} links)")
+    if blob_store:
+        print(f"  Call C (Preview):      preview-index.json + {len(blob_store.known_hashes)} blobs/*.json ({preview_files_created} previews)")
+    else:
+        print(f"  Call C (Preview):      {preview_files_created} preview-data-*.json files")
+    if stats:
+        print(f"  Query Stats:           {stats_files_created} stats-*.json files (facets + aggregates)")
+    print(f"  Call D (Dependencies): dependency-graph.json ({dependency_graph.node_count} nodes, {dependency_graph.link_count} links)")
+    if change_manifest:
+        print(f"  Change Feed:           changes/delta-*.json ({ticks} ticks, version {change_manifest['version']})")
     
     total_queries = sum(len(metadata["queries"]) for metadata in form_metadata.values())
     print(f"\n>> Data Breakdown:")
     print(f"  * Business Forms:      {len(form_summaries)}")
     print(f"  * Query Definitions:   {total_queries}")
     print(f"  * Preview Data Files:  {preview_files_created}")
+    if blob_store:
+        mb = 1024 * 1024
+        print(f"\n>> Preview Deduplication:")
+        print(f"  * Unique Blobs:        {len(blob_store.known_hashes)}")
+        print(f"  * Dedup Ratio:         {blob_store.dedup_ratio:.1f}x")
+        print(f"  * Logical Bytes:       {blob_store.logical_bytes / mb:.2f} MB")
+        print(f"  * Stored Bytes:        {blob_store.stored_bytes / mb:.2f} MB (incl. preview-index.json)")
+        print(f"  * Bytes Saved:         {(blob_store.logical_bytes - blob_store.stored_bytes) / mb:.2f} MB")
     print(f"\n>> Dependency Graph Breakdown:")
-    print(f"  * Total Nodes:         {len(dependency_graph['nodes'])}")
+    print(f"  * Total Nodes:         {dependency_graph.node_count}")
     print(f"    - Entities:          {node_counts['entity']}")
     print(f"    - Forms:             {node_counts['form']}")
     print(f"    - Documents:         {node_counts['document']}")
     print(f"    - Processes:         {node_counts['process']}")
     print(f"    - Dashboards:        {node_counts['dashboard']}")
-    print(f"  * Total Links:         {len(dependency_graph['links'])}")
+    print(f"  * Total Links:         {dependency_graph.link_count}")
     
     print(f"\n>> Three-Call Integration Pattern:")
     print(f"  1. Load form-summaries.json -> populate ng-select dropdown")
@@ -812,6 +1663,13 @@ def generate_three_call_mock_data(mode='full'):
     print(f"  GET /api/forms/{{id}}/metadata") 
     print(f"  GET /api/entities/{{entityId}}/records?queryId={{queryId}}")
     print(f"  GET /api/dependencies/graph")
+    
+    run_seconds = time.perf_counter() - run_started
+    print(f"\n>> Timing ({backend} backend):")
+    print(f"  * Import & Startup:    {(run_started - _SCRIPT_START) * 1000:.1f} ms")
+    print(f"  * Backend Init:        {backend_seconds * 1000:.1f} ms")
+    print(f"  * Generation:          {run_seconds - backend_seconds:.2f} s")
+    print(f"  * Start to Finish:     {time.perf_counter() - _SCRIPT_START:.2f} s")
     print("\n")
 
 if __name__ == "__main__":
@@ -824,6 +1682,12 @@ Examples:
   python scripts/generate-mock-data.py              # Full dataset (1032 forms)
   python scripts/generate-mock-data.py --light      # Light dataset (24 forms for Netlify)
   python scripts/generate-mock-data.py --scale      # Scale test (1300 forms, 800 entities, 1000 queries, 400 forms, 100 docs)
+  python scripts/generate-mock-data.py --ticks 48   # Plus 48 hourly change batches in changes/
+  python scripts/generate-mock-data.py --backend tables  # Full dataset without importing Faker
+  python scripts/generate-mock-data.py --partition 1/4   # Slice 1 of 4 (repeat for 2/4..4/4)
+  python scripts/generate-mock-data.py --merge 4         # Stitch the 4 slices together
+  python scripts/generate-mock-data.py --dedup           # Content-addressed preview blobs
+  python scripts/generate-mock-data.py --stats           # Per-query facet/aggregate stats files
         """
     )
     parser.add_argument(
@@ -836,6 +1700,82 @@ Examples:
         action='store_true',
         help='Generate scale test dataset (1300 forms total) for performance testing'
     )
+    parser.add_argument(
+        '--benchmark-graph-memory',
+        type=int,
+        nargs='?',
+        const=1_000_000,
+        default=None,
+        metavar='LINKS',
+        help='Only measure dependency graph peak memory (compact vs dict model) for ~LINKS links (default: 1,000,000)'
+    )
+    parser.add_argument(
+        '--partition',
+        type=parse_partition,
+        default=None,
+        metavar='K/N',
+        help='Generate only slice K of N (by category) into partitions/part-K-of-N/'
+    )
+    parser.add_argument(
+        '--merge',
+        type=int,
+        default=None,
+        metavar='N',
+        help='Merge partitions/part-*-of-N/ into the top-level files'
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=None,
+        help='Random seed for reproducible output (partitions default to 0)'
+    )
+    parser.add_argument(
+        '--anchor-date',
+        type=parse_anchor_date,
+        default=None,
+        metavar='YYYY-MM-DD',
+        help='Date that relative dates (-7d, now) resolve against (default: 2026-01-01 for seeded runs, today otherwise)'
+    )
+    parser.add_argument(
+        '--dedup',
+        action='store_true',
+        help='Store preview payloads once under blobs/{hash}.json with a preview-index.json routing index'
+    )
+    parser.add_argument(
+        '--stats',
+        action='store_true',
+        help='Write stats-{entityId}-{queryId}.json with facet counts and numeric aggregates per query'
+    )
+    parser.add_argument(
+        '--backend',
+        choices=['auto', 'tables', 'faker'],
+        default='auto',
+        help='Value source: bundled tables (fast start) or Faker (default: tables for --light, faker otherwise)'
+    )
+    parser.add_argument(
+        '--ticks',
+        type=int,
+        default=0,
+        help='Generate N incremental change batches (changes/delta-*.json) after the snapshot'
+    )
+    parser.add_argument(
+        '--change-fraction',
+        type=float,
+        default=0.05,
+        help='Fraction of queries mutated per tick (default: 0.05)'
+    )
+    parser.add_argument(
+        '--record-change-fraction',
+        type=float,
+        default=0.02,
+        help='Fraction of preview records mutated per tick (default: 0.02)'
+    )
+    parser.add_argument(
+        '--tick-seconds',
+        type=int,
+        default=3600,
+        help='Simulated seconds between ticks (default: 3600)'
+    )
     
     args = parser.parse_args()
     
@@ -847,11 +1787,32 @@ Examples:
         mode = 'full'
     
     try:
-        generate_three_call_mock_data(mode=mode)
+        if args.benchmark_graph_memory:
+            benchmark_graph_memory(args.benchmark_graph_memory)
+        elif args.merge:
+            merge_partitions(args.merge, seed=args.seed or 0)
+        elif args.partition and args.ticks:
+            parser.error("--ticks cannot be combined with --partition")
+        else:
+            generate_three_call_mock_data(
+                mode=mode,
+                ticks=args.ticks,
+                change_fraction=args.change_fraction,
+                record_change_fraction=args.record_change_fraction,
+                tick_seconds=args.tick_seconds,
+                backend=args.backend,
+                partition=args.partition,
+                seed=args.seed,
+                dedup=args.dedup,
+                stats=args.stats,
+                anchor_date=args.anchor_date
+            )
     except ImportError:
-        print("\n[ERROR] 'faker' library not installed")
+        print("\n[ERROR] 'faker' library not installed (required by --backend faker)")
         print("Please install it using: pip install faker")
         print("\n")
+        raise SystemExit(1)
     except Exception as e:
         print(f"\n[ERROR] {str(e)}")
         print("\n")
+        raise SystemExit(1)
@@ -0,0 +1,414 @@
+"""
+SPX Magic Selector - Four-Call Session Replay Load Generator
+
+Replays synthetic user sessions against the generated mock data, following the
+same flow the selector uses in the browser:
+- Call A: form-summaries.json (populate dropdown)
+- Call B: form-metadata.json (user selects a form -> show its queries)
+- Call C: preview-data-{entityId}-{queryId}.json (user clicks a query)
+- Call D: dependency-graph.json (user opens the dependency inspector)
+
+Sessions are built from the generated form-metadata.json with Zipf-skewed form
+and query popularity, then replayed concurrently with asyncio against either a
+static server (--base-url) or a local mock server started by this script.
+
+Client-side caching mirrors SelectionDataService: summaries, metadata and the
+graph are fetched once per session (shareReplay), preview data is not cached.
+The local mock server keeps an LRU of file bytes and reports X-Cache HIT/MISS.
+
+Trees generated with --dedup are replayed through preview-index.json (fetched
+once per session, reported as its own "Call C (Routing)" row) and
+blobs/{hash}.json; blobs are immutable, so the client caches them too.
+
+No third-party packages required.
+
+Usage:
+  python scripts/load-test-mock-data.py                          # Local mock server, 200 sessions
+  python scripts/load-test-mock-data.py --sessions 2000 --concurrency 64
+  python scripts/load-test-mock-data.py --base-url http://localhost:4200/assets/magic-selector-data
+"""
+
+import os
+import math
+import time
+import random
+import asyncio
+import argparse
+from bisect import bisect_left
+from collections import OrderedDict
+from itertools import accumulate
+from urllib.parse import urlsplit, unquote
+
+from mock_data_loader import MockDataLoader
+
+# Configuration
+BASE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src", "assets", "magic-selector-data")
+
+# "R" is the preview-index.json lookup that precedes Call C on --dedup trees
+CALL_TYPES = ["A", "B", "R", "C", "D"]
+CALL_LABELS = {
+    "A": "Call A (Summaries)",
+    "B": "Call B (Metadata)",
+    "R": "Call C (Routing)",
+    "C": "Call C (Preview)",
+    "D": "Call D (Graph)"
+}
+
+def zipf_cdf(n, s):
+    """Build a cumulative Zipf distribution over ranks 1..n
+
+    Args:
+        n: Number of ranked items
+        s: Skew exponent (s=0 is uniform, s>1 is heavily skewed)
+    """
+    return list(accumulate(1.0 / (rank ** s) for rank in range(1, n + 1)))
+
+def zipf_pick(rng, items, cdf):
+    """Pick an item from a ranked list using a precomputed Zipf CDF"""
+    return items[bisect_left(cdf, rng.random() * cdf[-1])]
+
+def build_sessions(form_metadata, num_sessions, zipf_s=1.1, query_zipf_s=1.2,
+                   min_clicks=1, max_clicks=4, inspector_rate=0.3, seed=None, preview_routes=None):
+    """Build synthetic user sessions from the generated form metadata
+
+    Forms are ranked in a shuffled (but seeded) order so popularity is not tied
+    to file order; queries are ranked within each form.
+
+    Args:
+        form_metadata: Parsed form-metadata.json (formId -> metadata)
+        num_sessions: Number of sessions to build
+        zipf_s: Zipf exponent for form popularity
+        query_zipf_s: Zipf exponent for query popularity within a form
+        min_clicks: Minimum number of query clicks per session
+        max_clicks: Maximum number of query clicks per session
+        inspector_rate: Probability of opening the dependency inspector after each click
+        seed: Random seed for reproducible sessions
+        preview_routes: Parsed preview-index.json for --dedup trees (None = per-query files)
+
+    Returns:
+        List of sessions, each a list of (call_type, filename) steps
+    """
+    rng = random.Random(seed)
+    ranked_forms = [m for m in form_metadata.values() if m.get("queries")]
+    if not ranked_forms:
+        raise ValueError("form-metadata.json contains no forms with queries")
+    rng.shuffle(ranked_forms)
+    form_cdf = zipf_cdf(len(ranked_forms), zipf_s)
+    query_cdfs = {}
+
+    sessions = []
+    for _ in range(num_sessions):
+        steps = [("A", "form-summaries.json")]
+        for _ in range(rng.randint(min_clicks, max_clicks)):
+            metadata = zipf_pick(rng, ranked_forms, form_cdf)
+            queries = metadata["queries"]
+            if len(queries) not in query_cdfs:
+                query_cdfs[len(queries)] = zipf_cdf(len(queries), query_zipf_s)
+            query = zipf_pick(rng, queries, query_cdfs[len(queries)])
+
+            steps.append(("B", "form-metadata.json"))
+            if preview_routes is not None:
+                steps.append(("R", "preview-index.json"))
+                route = preview_routes.get(metadata["entityId"], {}).get(query["id"])
+                if route is None:
+                    raise ValueError(f"preview-index.json has no route for {metadata['entityId']}/{query['id']}")
+                steps.append(("C", f"blobs/{route['hash']}.json"))
+            else:
+                steps.append(("C", f"preview-data-{metadata['entityId']}-{query['id']}.json"))
+            if rng.random() < inspector_rate:
+                steps.append(("D", "dependency-graph.json"))
+        sessions.append(steps)
+
+    return sessions
+
+async def http_get(host, port, path, timeout):
+    """Minimal HTTP/1.1 GET over asyncio streams
+
+    Returns:
+        Tuple of (status code, headers dict, body length)
+    """
+    reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+    try:
+        writer.write(
+            f"GET {path} HTTP/1.1\r\nHost: {host}:{port}\r\n"
+            f"Accept: application/json\r\nConnection: close\r\n\r\n".encode("latin-1")
+        )
+        await writer.drain()
+        head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout)
+        lines = head.decode("latin-1").split("\r\n")
+        status = int(lines[0].split(" ", 2)[1])
+        headers = {}
+        for line in lines[1:]:
+            if ":" in line:
+                key, value = line.split(":", 1)
+                headers[key.strip().lower()] = value.strip()
+        if "content-length" in headers:
+            body = await asyncio.wait_for(reader.readexactly(int(headers["content-length"])), timeout)
+        else:
+            body = await asyncio.wait_for(reader.read(), timeout)
+        return status, headers, len(body)
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
+
+class MockServer:
+    """Local static file server for the generated asset directory
+
+    Keeps a size-bounded LRU of file bytes so repeated requests for popular
+    files are served from memory, and tags every response with X-Cache.
+    """
+
+    def __init__(self, data_dir, cache_bytes=64 * 1024 * 1024, latency_ms=0.0):
+        self.data_dir = os.path.abspath(data_dir)
+        self.cache_bytes = cache_bytes
+        self.latency_ms = latency_ms
+        self.cache = OrderedDict()
+        self.cached_size = 0
+        self.server = None
+
+    def read_file(self, filename):
+        """Return (bytes, cache_status) for a file, or (None, None) if missing"""
+        if filename in self.cache:
+            self.cache.move_to_end(filename)
+            return self.cache[filename], "HIT"
+
+        filepath = os.path.abspath(os.path.join(self.data_dir, filename))
+        if os.path.commonpath([filepath, self.data_dir]) != self.data_dir or not os.path.isfile(filepath):
+            return None, None
+        with open(filepath, "rb") as f:
+            data = f.read()
+
+        if len(data) <= self.cache_bytes:
+            self.cache[filename] = data
+            self.cached_size += len(data)
+            while self.cached_size > self.cache_bytes:
+                _, evicted = self.cache.popitem(last=False)
+                self.cached_size -= len(evicted)
+        return data, "MISS"
+
+    async def handle(self, reader, writer):
+        """Serve a single GET request and close the connection"""
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+            request_line = head.split(b"\r\n", 1)[0].decode("latin-1")
+            method, target, _ = request_line.split(" ", 2)
+            filename = unquote(urlsplit(target).path).lstrip("/")
+
+            data, cache_status = self.read_file(filename) if method == "GET" else (None, None)
+            if self.latency_ms:
+                await asyncio.sleep(self.latency_ms / 1000.0)
+
+            if data is None:
+                body = b'{"error": "not found"}'
+                status_line = "HTTP/1.1 404 Not Found"
+                cache_status = "MISS"
+            else:
+                body = data
+                status_line = "HTTP/1.1 200 OK"
+            writer.write(
+                f"{status_line}\r\nContent-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\nX-Cache: {cache_status}\r\n"
+                f"Connection: close\r\n\r\n".encode("latin-1") + body
+            )
+            await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host="127.0.0.1", port=0):
+        """Start listening and return the base URL"""
+        self.server = await asyncio.start_server(self.handle, host, port, backlog=1024)
+        port = self.server.sockets[0].getsockname()[1]
+        return f"http://{host}:{port}"
+
+    async def stop(self):
+        if self.server:
+            self.server.close()
+            await self.server.wait_closed()
+
+class CallStats:
+    """Latency samples and cache counters for one call type"""
+
+    def __init__(self):
+        self.latencies = []
+        self.errors = 0
+        self.bytes = 0
+        self.client_hits = 0
+        self.server_hits = 0
+        self.server_tagged = 0
+
+    @property
+    def requests(self):
+        return len(self.latencies) + self.errors + self.client_hits
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = min(max(1, math.ceil(pct / 100.0 * len(sorted_values))), len(sorted_values))
+    return sorted_values[rank - 1]
+
+async def replay_session(steps, host, port, prefix, stats, timeout):
+    """Replay one session, applying SelectionDataService's client-side caching"""
+    client_cache = set()
+    for call_type, filename in steps:
+        call_stats = stats[call_type]
+        # Calls A, B, D and the routing index are shareReplay'd by the service; Call C only caches immutable blobs
+        cacheable = call_type != "C" or filename.startswith("blobs/")
+        if cacheable and filename in client_cache:
+            call_stats.client_hits += 1
+            continue
+
+        started = time.perf_counter()
+        try:
+            status, headers, size = await http_get(host, port, f"{prefix}/{filename}", timeout)
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError):
+            call_stats.errors += 1
+            continue
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+
+        if status != 200:
+            call_stats.errors += 1
+            continue
+        call_stats.latencies.append(elapsed_ms)
+        call_stats.bytes += size
+        if "x-cache" in headers:
+            call_stats.server_tagged += 1
+            if headers["x-cache"].upper().startswith("HIT"):
+                call_stats.server_hits += 1
+        if cacheable:
+            client_cache.add(filename)
+
+async def run_load_test(sessions, base_url, concurrency, timeout):
+    """Replay all sessions with at most `concurrency` sessions in flight
+
+    Returns:
+        Tuple of (stats per call type, wall-clock seconds)
+    """
+    parts = urlsplit(base_url)
+    if parts.scheme != "http":
+        raise ValueError(f"Only http:// base URLs are supported (got {base_url})")
+    host = parts.hostname
+    port = parts.port or 80
+    prefix = parts.path.rstrip("/")
+
+    stats = {call_type: CallStats() for call_type in CALL_TYPES}
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(steps):
+        async with semaphore:
+            await replay_session(steps, host, port, prefix, stats, timeout)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(bounded(steps) for steps in sessions))
+    return stats, time.perf_counter() - started
+
+def print_report(stats, wall_seconds, num_sessions):
+    """Print latency percentiles, throughput and cache hit rates per call type"""
+    total_network = sum(len(s.latencies) + s.errors for s in stats.values())
+    total_bytes = sum(s.bytes for s in stats.values())
+
+    print("\n" + "=" * 70)
+    print(f"[SUCCESS] Replayed {num_sessions} sessions in {wall_seconds:.2f}s")
+    print(f"  Network requests:      {total_network} ({total_network / wall_seconds:.1f} req/s)")
+    print(f"  Bytes transferred:     {total_bytes / (1024 * 1024):.1f} MB ({total_bytes / (1024 * 1024) / wall_seconds:.1f} MB/s)")
+
+    print("\n>> Latency per call type (ms, network requests only):")
+    print(f"  {'Call':<20} {'reqs':>7} {'err':>5} {'p50':>8} {'p95':>8} {'p99':>8} {'req/s':>8}")
+    for call_type in CALL_TYPES:
+        s = stats[call_type]
+        if not s.requests:
+            continue
+        ordered = sorted(s.latencies)
+        print(f"  {CALL_LABELS[call_type]:<20} {len(ordered):>7} {s.errors:>5} "
+              f"{percentile(ordered, 50):>8.2f} {percentile(ordered, 95):>8.2f} {percentile(ordered, 99):>8.2f} "
+              f"{len(ordered) / wall_seconds:>8.1f}")
+
+    print("\n>> Cache hit rates per call type:")
+    print(f"  {'Call':<20} {'client':>10} {'server':>10}")
+    for call_type in CALL_TYPES:
+        s = stats[call_type]
+        if not s.requests:
+            continue
+        client_rate = f"{100.0 * s.client_hits / s.requests:.1f}%" if s.requests else "-"
+        server_rate = f"{100.0 * s.server_hits / s.server_tagged:.1f}%" if s.server_tagged else "n/a"
+        print(f"  {CALL_LABELS[call_type]:<20} {client_rate:>10} {server_rate:>10}")
+    print("\n")
+
+async def main(args):
+    loader = MockDataLoader(args.data_dir)
+    form_metadata = loader.metadata()
+    preview_routes = loader.preview_routes()
+
+    print(f"\n*** SPX Magic Selector - Four-Call Session Replay [{args.sessions} sessions, concurrency {args.concurrency}] ***")
+    print("=" * 70)
+    sessions = build_sessions(
+        form_metadata,
+        args.sessions,
+        zipf_s=args.zipf,
+        query_zipf_s=args.query_zipf,
+        min_clicks=args.min_clicks,
+        max_clicks=args.max_clicks,
+        inspector_rate=args.inspector_rate,
+        seed=args.seed,
+        preview_routes=preview_routes
+    )
+    print(f"[OK] Built {len(sessions)} sessions ({sum(len(s) for s in sessions)} calls) from {len(form_metadata)} forms")
+
+    server = None
+    base_url = args.base_url
+    if not base_url:
+        server = MockServer(args.data_dir, cache_bytes=args.server_cache_mb * 1024 * 1024, latency_ms=args.server_latency_ms)
+        base_url = await server.start()
+        print(f"[OK] Local mock server listening on {base_url}")
+
+    try:
+        stats, wall_seconds = await run_load_test(sessions, base_url, args.concurrency, args.timeout)
+    finally:
+        if server:
+            await server.stop()
+
+    print_report(stats, wall_seconds, len(sessions))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Replay Four-Call user sessions against the SPX Magic Selector mock data",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python scripts/load-test-mock-data.py                                   # Local mock server
+  python scripts/load-test-mock-data.py --sessions 5000 --concurrency 128 # Heavier run
+  python scripts/load-test-mock-data.py --base-url http://localhost:4200/assets/magic-selector-data
+        """
+    )
+    parser.add_argument('--data-dir', default=BASE_DIR, help='Generated asset directory (default: src/assets/magic-selector-data)')
+    parser.add_argument('--base-url', default=None, help='Static server URL serving the asset directory (default: start a local mock server)')
+    parser.add_argument('--sessions', type=int, default=200, help='Number of user sessions to replay')
+    parser.add_argument('--concurrency', type=int, default=32, help='Maximum sessions in flight')
+    parser.add_argument('--zipf', type=float, default=1.1, help='Zipf exponent for form popularity')
+    parser.add_argument('--query-zipf', type=float, default=1.2, help='Zipf exponent for query popularity within a form')
+    parser.add_argument('--min-clicks', type=int, default=1, help='Minimum query clicks per session')
+    parser.add_argument('--max-clicks', type=int, default=4, help='Maximum query clicks per session')
+    parser.add_argument('--inspector-rate', type=float, default=0.3, help='Probability of opening the dependency inspector after a click')
+    parser.add_argument('--seed', type=int, default=None, help='Random seed for reproducible sessions')
+    parser.add_argument('--timeout', type=float, default=10.0, help='Per-request timeout in seconds')
+    parser.add_argument('--server-cache-mb', type=int, default=64, help='Local mock server LRU size in MB')
+    parser.add_argument('--server-latency-ms', type=float, default=0.0, help='Artificial latency added by the local mock server')
+
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(main(args))
+    except FileNotFoundError as e:
+        print(f"\n[ERROR] {str(e)}")
+        print("Generate the mock data first: python scripts/generate-mock-data.py")
+        print("\n")
+        raise SystemExit(1)
+    except Exception as e:
+        print(f"\n[ERROR] {str(e)}")
+        print("\n")
+        raise SystemExit(1)
@@ -0,0 +1,245 @@
+"""
+Cached loader for the SPX Magic Selector generated asset tree
+
+Lazy, cached access to the Four-Call files for Python tooling (validators,
+reports, test fixtures) instead of calling json.load on the same
+multi-megabyte files over and over:
+- Call A/B: form-summaries.json and form-metadata.json are parsed once and
+  kept until the file's mtime/size changes (checked with one os.stat per access)
+- Call C:   preview payloads (per-query files, or preview-index.json + blobs/
+  for --dedup trees) and stats files live in a size-bounded LRU
+- Call D:   dependency-graph.json with lazily built node, adjacency and
+  reverse-adjacency indexes
+
+Lookups by id are O(1) dict hits once the indexes exist. Returned objects are
+shared with the cache, so treat them as read-only.
+
+Usage:
+  from mock_data_loader import MockDataLoader
+
+  loader = MockDataLoader()                       # src/assets/magic-selector-data
+  form = loader.form("client-portfolio-form")
+  preview = loader.preview_for_query(form["id"], "query-all-records")
+  dependents = loader.dependents("e1")            # links pointing at entity e1
+"""
+
+import json
+import os
+from collections import OrderedDict
+
+BASE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src", "assets", "magic-selector-data")
+
+# Parsed JSON payloads hold ~2.5-2.8x their file size in memory (measured with
+# tracemalloc on previews, blobs and stats files); round up so the budget holds
+PARSED_SIZE_FACTOR = 3
+
+class _CachedFile:
+    """Parsed JSON plus the (mtime_ns, size) it was parsed from"""
+
+    __slots__ = ("signature", "data")
+
+    def __init__(self, signature, data):
+        self.signature = signature
+        self.data = data
+
+class MockDataLoader:
+    """Lazy, cached reader for one generated asset directory
+
+    Args:
+        data_dir: Generated asset directory (default: src/assets/magic-selector-data)
+        preview_cache_bytes: Memory budget for cached preview/blob/stats payloads,
+                             estimated as file size x PARSED_SIZE_FACTOR (default: 32 MB)
+    """
+
+    def __init__(self, data_dir=BASE_DIR, preview_cache_bytes=32 * 1024 * 1024):
+        self.data_dir = data_dir
+        self.preview_cache_bytes = preview_cache_bytes
+        self._files = {}
+        self._derived = {}
+        self._lru = OrderedDict()
+        self._lru_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    # --- mtime-checked index files (Call A, B, D, preview-index.json) ---
+
+    def _load_index(self, filename):
+        """Return parsed JSON for an index file, reparsing only if it changed on disk"""
+        stat = os.stat(os.path.join(self.data_dir, filename))
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._files.get(filename)
+        if cached and cached.signature == signature:
+            return cached.data
+
+        with open(os.path.join(self.data_dir, filename), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        self._files[filename] = _CachedFile(signature, data)
+        # Drop indexes derived from the previous version of this file
+        for key in [key for key in self._derived if key[0] == filename]:
+            del self._derived[key]
+        return data
+
+    def _derive(self, filename, name, build):
+        """Return an index built from an index file, rebuilding after the file changes"""
+        data = self._load_index(filename)
+        key = (filename, name)
+        if key not in self._derived:
+            self._derived[key] = build(data)
+        return self._derived[key]
+
+    def invalidate(self):
+        """Forget every cached file, index and payload"""
+        self._files.clear()
+        self._derived.clear()
+        self._lru.clear()
+        self._lru_bytes = 0
+
+    # --- Call A / Call B ---
+
+    def summaries(self):
+        """All form summaries (form-summaries.json)"""
+        return self._load_index("form-summaries.json")
+
+    def metadata(self):
+        """All form metadata keyed by form id (form-metadata.json)"""
+        return self._load_index("form-metadata.json")
+
+    def form(self, form_id):
+        """Metadata for one form, or None"""
+        return self.metadata().get(form_id)
+
+    def queries(self, form_id):
+        """Queries of one form keyed by query id ({} for unknown forms)"""
+        index = self._derive("form-metadata.json", "queries", lambda metadata: {
+            form_id: {query["id"]: query for query in form["queries"]}
+            for form_id, form in metadata.items()
+        })
+        return index.get(form_id, {})
+
+    def query(self, form_id, query_id):
+        """One query definition, or None"""
+        return self.queries(form_id).get(query_id)
+
+    def forms_for_entity(self, entity_id):
+        """Form ids that use a given per-form entityId"""
+        index = self._derive("form-metadata.json", "by-entity", self._build_entity_index)
+        return index.get(entity_id, [])
+
+    @staticmethod
+    def _build_entity_index(metadata):
+        index = {}
+        for form_id, form in metadata.items():
+            index.setdefault(form["entityId"], []).append(form_id)
+        return index
+
+    # --- Call C (size-bounded LRU) ---
+
+    def _load_payload(self, relative_path):
+        """Return a parsed payload file through the LRU, or None if it does not exist"""
+        cached = self._lru.get(relative_path)
+        if cached is not None:
+            self._lru.move_to_end(relative_path)
+            self.hits += 1
+            return cached[1]
+
+        filepath = os.path.join(self.data_dir, relative_path)
+        try:
+            size = os.path.getsize(filepath) * PARSED_SIZE_FACTOR
+            with open(filepath, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        self.misses += 1
+
+        if size <= self.preview_cache_bytes:
+            self._lru[relative_path] = (size, data)
+            self._lru_bytes += size
+            while self._lru_bytes > self.preview_cache_bytes:
+                _, (evicted_size, _) = self._lru.popitem(last=False)
+                self._lru_bytes -= evicted_size
+        return data
+
+    def preview_routes(self):
+        """Parsed preview-index.json for --dedup trees, or None"""
+        if not os.path.exists(os.path.join(self.data_dir, "preview-index.json")):
+            return None
+        return self._load_index("preview-index.json")
+
+    def preview(self, entity_id, query_id):
+        """Preview payload for (entityId, queryId), or None
+
+        Per-query files are returned as stored. For --dedup trees the payload is
+        rebuilt from the routing entry and the shared blob.
+        """
+        routes = self.preview_routes()
+        if routes is None:
+            return self._load_payload(f"preview-data-{entity_id}-{query_id}.json")
+
+        route = routes.get(entity_id, {}).get(query_id)
+        if route is None:
+            return None
+        body = self._load_payload(os.path.join("blobs", f"{route['hash']}.json"))
+        if body is None:
+            return None
+        return {"entityId": entity_id, "queryId": query_id, "totalCount": route["totalCount"], **body}
+
+    def preview_for_query(self, form_id, query_id):
+        """Preview payload for a form's query, resolving the form's entityId"""
+        form = self.form(form_id)
+        return self.preview(form["entityId"], query_id) if form else None
+
+    def stats(self, entity_id, query_id):
+        """Facet/aggregate stats for (entityId, queryId) from --stats runs, or None"""
+        return self._load_payload(f"stats-{entity_id}-{query_id}.json")
+
+    # --- Call D ---
+
+    def graph(self):
+        """Parsed dependency-graph.json"""
+        return self._load_index("dependency-graph.json")
+
+    def node(self, node_id):
+        """One graph node by id, or None"""
+        index = self._derive("dependency-graph.json", "nodes", lambda graph: {
+            node["id"]: node for node in graph["nodes"]
+        })
+        return index.get(node_id)
+
+    def links_from(self, node_id):
+        """Links whose source is node_id (adjacency)"""
+        index = self._derive("dependency-graph.json", "adjacency", lambda graph: self._group_links(graph, "source"))
+        return index.get(node_id, [])
+
+    def links_to(self, node_id):
+        """Links whose target is node_id (reverse adjacency)"""
+        index = self._derive("dependency-graph.json", "reverse-adjacency", lambda graph: self._group_links(graph, "target"))
+        return index.get(node_id, [])
+
+    def dependencies(self, node_id):
+        """Ids of nodes that node_id links to"""
+        return [link["target"] for link in self.links_from(node_id)]
+
+    def dependents(self, node_id):
+        """Ids of nodes that link to node_id"""
+        return [link["source"] for link in self.links_to(node_id)]
+
+    @staticmethod
+    def _group_links(graph, endpoint):
+        index = {}
+        for link in graph["links"]:
+            index.setdefault(link[endpoint], []).append(link)
+        return index
+
+    # --- Introspection ---
+
+    def cache_info(self):
+        """Payload LRU counters (cachedBytes is the estimated in-memory size) plus parsed index files"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "cachedPayloads": len(self._lru),
+            "cachedBytes": self._lru_bytes,
+            "maxBytes": self.preview_cache_bytes,
+            "indexFiles": sorted(self._files),
+            "derivedIndexes": sorted(f"{filename}:{name}" for filename, name in self._derived)
+        }
@@ -0,0 +1,192 @@
+"""
+Bundled value tables for the SPX Magic Selector mock data generator
+
+A drop-in replacement for the subset of Faker used by generate-mock-data.py
+(name, first_name, last_name, email, phone_number, catch_phrase, word,
+sentence, date_between, date_time_between). Values are drawn from the
+precompiled tuples below with the stdlib `random` module, so importing this
+module costs a few milliseconds instead of Faker's provider/locale loading.
+
+Seeding `random` and passing a fixed `now` makes TableFaker output reproducible.
+"""
+
+import random
+from datetime import date, datetime, timedelta
+
+FIRST_NAMES = (
+    "James", "Mary", "Robert", "Patricia", "John", "Jennifer", "Michael", "Linda",
+    "David", "Elizabeth", "William", "Barbara", "Richard", "Susan", "Joseph", "Jessica",
+    "Thomas", "Sarah", "Christopher", "Karen", "Charles", "Lisa", "Daniel", "Nancy",
+    "Matthew", "Betty", "Anthony", "Sandra", "Mark", "Margaret", "Donald", "Ashley",
+    "Steven", "Kimberly", "Andrew", "Emily", "Paul", "Donna", "Joshua", "Michelle",
+    "Kenneth", "Carol", "Kevin", "Amanda", "Brian", "Melissa", "George", "Deborah",
+    "Timothy", "Stephanie", "Ronald", "Rebecca", "Jason", "Sharon", "Edward", "Laura",
+    "Jeffrey", "Cynthia", "Ryan", "Dorothy", "Jacob", "Amy", "Gary", "Kathleen",
+    "Nicholas", "Angela", "Eric", "Shirley", "Jonathan", "Emma", "Stephen", "Brenda",
+    "Larry", "Pamela", "Justin", "Nicole", "Scott", "Anna", "Brandon", "Samantha",
+    "Benjamin", "Katherine", "Samuel", "Christine", "Gregory", "Debra", "Alexander", "Rachel",
+    "Patrick", "Carolyn", "Frank", "Janet", "Raymond", "Maria", "Jack", "Olivia",
+    "Dennis", "Heather", "Jerry", "Helen", "Tyler", "Catherine", "Aaron", "Diane",
+    "Jose", "Julie", "Adam", "Victoria", "Nathan", "Joyce", "Henry", "Lauren",
+)
+
+LAST_NAMES = (
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+    "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson", "Thomas",
+    "Taylor", "Moore", "Jackson", "Martin", "Lee", "Perez", "Thompson", "White",
+    "Harris", "Sanchez", "Clark", "Ramirez", "Lewis", "Robinson", "Walker", "Young",
+    "Allen", "King", "Wright", "Scott", "Torres", "Nguyen", "Hill", "Flores",
+    "Green", "Adams", "Nelson", "Baker", "Hall", "Rivera", "Campbell", "Mitchell",
+    "Carter", "Roberts", "Gomez", "Phillips", "Evans", "Turner", "Diaz", "Parker",
+    "Cruz", "Edwards", "Collins", "Reyes", "Stewart", "Morris", "Morales", "Murphy",
+    "Cook", "Rogers", "Gutierrez", "Ortiz", "Morgan", "Cooper", "Peterson", "Bailey",
+    "Reed", "Kelly", "Howard", "Ramos", "Kim", "Cox", "Ward", "Richardson",
+    "Watson", "Brooks", "Chavez", "Wood", "James", "Bennett", "Gray", "Mendoza",
+    "Ruiz", "Hughes", "Price", "Alvarez", "Castillo", "Sanders", "Patel", "Myers",
+)
+
+EMAIL_DOMAINS = (
+    "gmail.com", "yahoo.com", "hotmail.com", "outlook.com", "icloud.com",
+    "example.com", "example.org", "example.net",
+)
+
+PHONE_FORMATS = (
+    "###-###-####", "(###)###-####", "###.###.####", "+1-###-###-####",
+    "###-###-####x###", "(###)###-####x####", "001-###-###-####",
+)
+
+CATCH_PHRASE_ADJECTIVES = (
+    "Adaptive", "Advanced", "Automated", "Balanced", "Centralized", "Compatible",
+    "Configurable", "Cross-platform", "Customer-focused", "Decentralized", "Digitized",
+    "Distributed", "Enhanced", "Enterprise-wide", "Ergonomic", "Expanded", "Focused",
+    "Fundamental", "Horizontal", "Innovative", "Integrated", "Intuitive", "Managed",
+    "Monitored", "Multi-layered", "Networked", "Open-source", "Optimized", "Organic",
+    "Persistent", "Proactive", "Profound", "Progressive", "Quality-focused", "Reactive",
+    "Reduced", "Robust", "Seamless", "Secured", "Streamlined", "Synchronized",
+    "Team-oriented", "Total", "Triple-buffered", "Universal", "User-friendly", "Versatile",
+    "Virtual", "Visionary",
+)
+
+CATCH_PHRASE_DESCRIPTORS = (
+    "24/7", "24hour", "actuating", "analyzing", "asymmetric", "background", "bandwidth-monitored",
+    "client-driven", "client-server", "coherent", "composite", "content-based", "context-sensitive",
+    "contextually-based", "dedicated", "demand-driven", "dynamic", "executive", "explicit",
+    "global", "grid-enabled", "heuristic", "high-level", "holistic", "homogeneous", "hybrid",
+    "incremental", "interactive", "intermediate", "local", "logistical", "maximized", "methodical",
+    "mission-critical", "mobile", "modular", "motivating", "multimedia", "multi-state",
+    "national", "neutral", "next generation", "non-volatile", "optimal", "optimizing",
+    "radical", "real-time", "regional", "scalable", "secondary", "stable", "static",
+    "systematic", "systemic", "tangible", "tertiary", "transitional", "uniform", "zero-defect",
+)
+
+CATCH_PHRASE_NOUNS = (
+    "ability", "access", "adapter", "algorithm", "alliance", "analyzer", "application",
+    "approach", "architecture", "archive", "array", "attitude", "benchmark", "capability",
+    "capacity", "challenge", "circuit", "collaboration", "complexity", "concept", "conglomeration",
+    "contingency", "core", "database", "data-warehouse", "definition", "emulation", "encoding",
+    "encryption", "extranet", "firmware", "flexibility", "forecast", "frame", "framework",
+    "function", "functionalities", "groupware", "hardware", "help-desk", "hierarchy", "hub",
+    "implementation", "infrastructure", "initiative", "installation", "instruction set",
+    "interface", "knowledge base", "leverage", "matrix", "methodology", "middleware",
+    "migration", "model", "moderator", "monitoring", "moratorium", "neural-net", "paradigm",
+    "parallelism", "policy", "portal", "pricing structure", "process improvement", "product",
+    "productivity", "project", "protocol", "service-desk", "software", "solution", "standardization",
+    "strategy", "structure", "success", "superstructure", "support", "synergy", "system engine",
+    "task-force", "throughput", "time-frame", "toolset", "utilization", "website", "workforce",
+)
+
+WORDS = (
+    "account", "action", "advice", "allow", "amount", "analysis", "answer", "approach",
+    "area", "asset", "balance", "bank", "benefit", "budget", "business", "capital",
+    "case", "change", "choice", "client", "company", "cost", "credit", "current",
+    "data", "decision", "detail", "develop", "economy", "effect", "energy", "equity",
+    "estate", "exchange", "family", "financial", "focus", "fund", "future", "goal",
+    "growth", "income", "interest", "invest", "issue", "level", "market", "measure",
+    "money", "network", "option", "order", "owner", "payment", "period", "plan",
+    "policy", "position", "price", "process", "profit", "program", "rate", "record",
+    "report", "return", "review", "risk", "saving", "sector", "security", "service",
+    "share", "source", "stock", "strategy", "structure", "system", "tax", "trade",
+    "trust", "value", "wealth", "yield",
+)
+
+def resolve_relative_date(value, today):
+    """Resolve Faker-style relative dates ('now', '-7d', '+3d', '-1y', '-90d', '-10y')"""
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    if value in (None, "now", "today"):
+        return today
+
+    sign = -1 if value[0] == "-" else 1
+    amount = int(value.lstrip("+-")[:-1])
+    unit = value[-1]
+    if unit == "y":
+        return today + timedelta(days=sign * amount * 365.25)
+    if unit == "w":
+        return today + timedelta(weeks=sign * amount)
+    if unit == "d":
+        return today + timedelta(days=sign * amount)
+    if unit == "h":
+        return today + timedelta(hours=sign * amount)
+    if unit == "m":
+        return today + timedelta(minutes=sign * amount)
+    if unit == "s":
+        return today + timedelta(seconds=sign * amount)
+    raise ValueError(f"Unsupported relative date: {value}")
+
+class TableFaker:
+    """Faker-compatible value source backed by the bundled tables
+
+    Only the methods generate-mock-data.py calls are implemented, with the
+    same signatures and return types as Faker's en_US providers.
+    """
+
+    def __init__(self, rng=None, now=None):
+        self.rng = rng or random
+        # Reference time for relative dates ('-7d', 'now'); None = wall clock
+        self.now = now
+
+    def first_name(self):
+        return self.rng.choice(FIRST_NAMES)
+
+    def last_name(self):
+        return self.rng.choice(LAST_NAMES)
+
+    def name(self):
+        return f"{self.rng.choice(FIRST_NAMES)} {self.rng.choice(LAST_NAMES)}"
+
+    def email(self):
+        user = f"{self.rng.choice(FIRST_NAMES)}.{self.rng.choice(LAST_NAMES)}".lower()
+        if self.rng.random() < 0.5:
+            user += str(self.rng.randint(1, 99))
+        return f"{user}@{self.rng.choice(EMAIL_DOMAINS)}"
+
+    def phone_number(self):
+        rng = self.rng
+        return "".join(str(rng.randint(0, 9)) if ch == "#" else ch for ch in rng.choice(PHONE_FORMATS))
+
+    def catch_phrase(self):
+        return (f"{self.rng.choice(CATCH_PHRASE_ADJECTIVES)} "
+                f"{self.rng.choice(CATCH_PHRASE_DESCRIPTORS)} "
+                f"{self.rng.choice(CATCH_PHRASE_NOUNS)}")
+
+    def word(self):
+        return self.rng.choice(WORDS)
+
+    def sentence(self, nb_words=6, variable_nb_words=True):
+        if variable_nb_words:
+            nb_words = max(1, self.rng.randint(nb_words * 60 // 100, nb_words * 140 // 100))
+        words = [self.rng.choice(WORDS) for _ in range(nb_words)]
+        words[0] = words[0].capitalize()
+        return " ".join(words) + "."
+
+    def date_time_between(self, start_date="-30y", end_date="now"):
+        now = self.now or datetime.now().replace(microsecond=0)
+        start = resolve_relative_date(start_date, now)
+        end = resolve_relative_date(end_date, now)
+        span = max(0, int((end - start).total_seconds()))
+        return start + timedelta(seconds=self.rng.randint(0, span))
+
+    def date_between(self, start_date="-30y", end_date="today"):
+        return self.date_time_between(start_date, end_date).date()
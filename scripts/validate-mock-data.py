@@ -0,0 +1,297 @@
+"""
+SPX Magic Selector - Mock Data Referential-Integrity Validator
+
+Checks a generated asset tree for broken references between the Four-Call files:
+- Call A/B: every summary has metadata and vice versa (ids match their keys)
+- Call B/C: every query has a preview-data-{entityId}-{queryId}.json file,
+  no two queries map to the same file, and no preview file is orphaned
+- Call C:   preview payload entityId/queryId match the metadata and filename
+- Call D:   node ids are unique and every link source/target is an existing node
+
+Trees generated with --dedup are resolved through preview-index.json instead:
+every query needs an index entry, every entry's blobs/{hash}.json must exist,
+and unreferenced blobs or index entries are reported as orphans.
+
+The directory is listed once with os.scandir and all checks run against hash
+indexes (sets/dicts), so the cost is one pass over the file names plus one
+parse of each index file. Preview payloads are checked by peeking at the first
+bytes of each file (entityId/queryId are the first keys) rather than parsing
+the whole payload; use --payload-sample to bound how many files are opened.
+
+Exits with status 1 when any issue is found, so it can gate builds.
+
+Usage:
+  python scripts/validate-mock-data.py                       # Validate src/assets/magic-selector-data
+  python scripts/validate-mock-data.py --payload-sample 0    # Open every preview file
+  python scripts/validate-mock-data.py --data-dir /tmp/out   # Validate another tree
+"""
+
+import gc
+import json
+import os
+import re
+import sys
+import time
+import random
+import argparse
+from collections import defaultdict
+
+# Configuration
+BASE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src", "assets", "magic-selector-data")
+
+PREVIEW_PREFIX = "preview-data-"
+HEADER_BYTES = 512
+HEADER_PATTERN = re.compile(r'"(entityId|queryId)"\s*:\s*"([^"]*)"')
+
+ISSUE_LABELS = {
+    "summary-without-metadata": "Summaries without metadata",
+    "metadata-without-summary": "Metadata without summary",
+    "metadata-key-mismatch": "Metadata key != form id",
+    "duplicate-summary-id": "Duplicate summary ids",
+    "duplicate-query-id": "Duplicate query ids within a form",
+    "preview-filename-collision": "Queries sharing one preview file",
+    "dangling-preview-ref": "Queries without a preview file",
+    "orphaned-preview-file": "Preview files without a query",
+    "mismatched-entity-id": "Preview entityId != metadata entityId",
+    "mismatched-query-id": "Preview queryId != metadata query id",
+    "unreadable-preview": "Unreadable preview payloads",
+    "dangling-blob-ref": "Index entries without a blob file",
+    "orphaned-blob": "Blob files without an index entry",
+    "orphaned-index-entry": "Index entries without a query",
+    "duplicate-node-id": "Duplicate graph node ids",
+    "dangling-link-source": "Links with a missing source node",
+    "dangling-link-target": "Links with a missing target node",
+    "missing-file": "Missing index files"
+}
+
+class ValidationReport:
+    """Issue counts plus a bounded number of examples per issue type"""
+
+    def __init__(self, max_examples=10):
+        self.max_examples = max_examples
+        self.counts = defaultdict(int)
+        self.examples = defaultdict(list)
+        self.stats = {}
+        self.timings = []
+
+    def add(self, issue, detail):
+        self.counts[issue] += 1
+        if len(self.examples[issue]) < self.max_examples:
+            self.examples[issue].append(detail)
+
+    @property
+    def issue_count(self):
+        return sum(self.counts.values())
+
+def load_index_file(data_dir, filename, report):
+    """Parse one of the index JSON files, recording a missing-file issue if absent"""
+    filepath = os.path.join(data_dir, filename)
+    try:
+        with open(filepath, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        report.add("missing-file", filename)
+        return None
+
+def read_preview_header(filepath):
+    """Return {"entityId": ..., "queryId": ...} from the start of a preview file
+
+    Falls back to a full parse if the ids are not within the first bytes.
+    """
+    with open(filepath, "rb") as f:
+        head = f.read(HEADER_BYTES).decode("utf-8", errors="ignore")
+    found = dict(HEADER_PATTERN.findall(head))
+    if "entityId" in found and "queryId" in found:
+        return found
+    with open(filepath, "r", encoding="utf-8") as f:
+        payload = json.load(f)
+    return {"entityId": payload.get("entityId"), "queryId": payload.get("queryId")}
+
+def validate_tree(data_dir, payload_sample=5000, max_examples=10, seed=0):
+    """Validate a generated asset tree and return a ValidationReport
+
+    Args:
+        data_dir: Directory containing the generated files
+        payload_sample: Number of preview payloads to open (0 = all)
+        max_examples: Examples kept per issue type
+        seed: Seed for choosing the payload sample
+    """
+    report = ValidationReport(max_examples=max_examples)
+    phase_started = time.perf_counter()
+
+    def phase(label):
+        nonlocal phase_started
+        now = time.perf_counter()
+        report.timings.append((label, now - phase_started))
+        phase_started = now
+
+    # Single directory pass: hash index of preview filenames
+    preview_files = set()
+    with os.scandir(data_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith(PREVIEW_PREFIX) and name.endswith(".json"):
+                preview_files.add(name)
+    report.stats["previewFiles"] = len(preview_files)
+
+    # Deduplicated trees (--dedup): routing index + content-addressed blobs
+    blob_files = set()
+    if os.path.isdir(os.path.join(data_dir, "blobs")):
+        with os.scandir(os.path.join(data_dir, "blobs")) as entries:
+            blob_files = {entry.name for entry in entries if entry.name.endswith(".json")}
+    preview_routes = {}
+    if os.path.exists(os.path.join(data_dir, "preview-index.json")):
+        preview_routes = load_index_file(data_dir, "preview-index.json", report)
+    report.stats["blobs"] = len(blob_files)
+    phase("Scan directory")
+
+    # Call A <-> Call B
+    summaries = load_index_file(data_dir, "form-summaries.json", report) or []
+    metadata = load_index_file(data_dir, "form-metadata.json", report) or {}
+    phase("Parse summaries + metadata")
+
+    summary_ids = set()
+    for summary in summaries:
+        if summary["id"] in summary_ids:
+            report.add("duplicate-summary-id", summary["id"])
+        summary_ids.add(summary["id"])
+    for form_id in summary_ids.difference(metadata):
+        report.add("summary-without-metadata", form_id)
+    for form_id in metadata.keys() - summary_ids:
+        report.add("metadata-without-summary", form_id)
+    report.stats["forms"] = len(metadata)
+
+    # Call B -> Call C: expected filename -> (formId, entityId, queryId)
+    expected = {}
+    for form_id, form in metadata.items():
+        if form.get("id") != form_id:
+            report.add("metadata-key-mismatch", f"{form_id} (id={form.get('id')})")
+        entity_id = form.get("entityId")
+        seen_queries = set()
+        for query in form.get("queries", []):
+            query_id = query["id"]
+            if query_id in seen_queries:
+                report.add("duplicate-query-id", f"{form_id}/{query_id}")
+                continue
+            seen_queries.add(query_id)
+
+            filename = f"{PREVIEW_PREFIX}{entity_id}-{query_id}.json"
+            if filename in expected:
+                report.add("preview-filename-collision", f"{filename} <- {expected[filename][0]}, {form_id}")
+                continue
+            expected[filename] = (form_id, entity_id, query_id)
+            if filename not in preview_files and query_id not in preview_routes.get(entity_id, ()):
+                report.add("dangling-preview-ref", f"{form_id}/{query_id} -> {filename}")
+    report.stats["queries"] = len(expected)
+
+    for filename in preview_files.difference(expected):
+        report.add("orphaned-preview-file", filename)
+
+    referenced_blobs = set()
+    for entity_id, routes in preview_routes.items():
+        for query_id, route in routes.items():
+            blob_name = f"{route['hash']}.json"
+            referenced_blobs.add(blob_name)
+            if blob_name not in blob_files:
+                report.add("dangling-blob-ref", f"{entity_id}/{query_id} -> blobs/{blob_name}")
+            if f"{PREVIEW_PREFIX}{entity_id}-{query_id}.json" not in expected:
+                report.add("orphaned-index-entry", f"{entity_id}/{query_id}")
+    for blob_name in blob_files.difference(referenced_blobs):
+        report.add("orphaned-blob", f"blobs/{blob_name}")
+    phase("Cross-check queries/previews")
+
+    # Call C payload ids
+    present = [filename for filename in expected if filename in preview_files]
+    if payload_sample and len(present) > payload_sample:
+        present = random.Random(seed).sample(present, payload_sample)
+    for filename in present:
+        form_id, entity_id, query_id = expected[filename]
+        try:
+            header = read_preview_header(os.path.join(data_dir, filename))
+        except (OSError, ValueError) as e:
+            report.add("unreadable-preview", f"{filename}: {e}")
+            continue
+        if header["entityId"] != entity_id:
+            report.add("mismatched-entity-id", f"{filename}: payload {header['entityId']!r}, metadata {entity_id!r}")
+        if header["queryId"] != query_id:
+            report.add("mismatched-query-id", f"{filename}: payload {header['queryId']!r}, metadata {query_id!r}")
+    report.stats["payloadsChecked"] = len(present)
+    phase("Check preview payload ids")
+
+    # Call D
+    graph = load_index_file(data_dir, "dependency-graph.json", report) or {"nodes": [], "links": []}
+    node_ids = set()
+    for node in graph["nodes"]:
+        if node["id"] in node_ids:
+            report.add("duplicate-node-id", node["id"])
+        node_ids.add(node["id"])
+    for index, link in enumerate(graph["links"]):
+        if link["source"] not in node_ids:
+            report.add("dangling-link-source", f"links[{index}] {link['source']} -> {link['target']}")
+        if link["target"] not in node_ids:
+            report.add("dangling-link-target", f"links[{index}] {link['source']} -> {link['target']}")
+    report.stats["nodes"] = len(node_ids)
+    report.stats["links"] = len(graph["links"])
+    phase("Check dependency graph")
+
+    return report
+
+def print_report(report, data_dir):
+    """Print index sizes, issues with examples, and per-phase timings"""
+    total_seconds = sum(seconds for _, seconds in report.timings)
+    stats = report.stats
+
+    print(f"\n*** SPX Magic Selector - Mock Data Validator ***")
+    print("=" * 70)
+    print(f"  Directory:             {data_dir}")
+    print(f"  Forms:                 {stats.get('forms', 0)}")
+    print(f"  Queries:               {stats.get('queries', 0)}")
+    print(f"  Preview Files:         {stats.get('previewFiles', 0)} ({stats.get('payloadsChecked', 0)} payloads checked)")
+    if stats.get("blobs"):
+        print(f"  Preview Blobs:         {stats['blobs']} (via preview-index.json)")
+    print(f"  Graph:                 {stats.get('nodes', 0)} nodes, {stats.get('links', 0)} links")
+
+    if report.issue_count:
+        print(f"\n>> Issues ({report.issue_count}):")
+        for issue, label in ISSUE_LABELS.items():
+            if report.counts[issue]:
+                print(f"  [FAIL] {label}: {report.counts[issue]}")
+                for example in report.examples[issue]:
+                    print(f"         - {example}")
+    else:
+        print("\n[OK] No referential-integrity issues found")
+
+    print(f"\n>> Timing ({total_seconds:.2f}s total):")
+    for label, seconds in report.timings:
+        print(f"  * {label + ':':<30} {seconds * 1000:.1f} ms")
+    print("\n")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Validate referential integrity of the SPX Magic Selector mock data",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python scripts/validate-mock-data.py                       # Validate the default asset directory
+  python scripts/validate-mock-data.py --payload-sample 0    # Check every preview payload
+  python scripts/validate-mock-data.py --max-examples 50     # Show more examples per issue
+        """
+    )
+    parser.add_argument('--data-dir', default=BASE_DIR, help='Generated asset directory (default: src/assets/magic-selector-data)')
+    parser.add_argument('--payload-sample', type=int, default=5000, help='Preview payloads to open for id checks (0 = all, default: 5000)')
+    parser.add_argument('--max-examples', type=int, default=10, help='Examples to print per issue type (default: 10)')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for the payload sample (default: 0)')
+
+    args = parser.parse_args()
+
+    # The parsed indexes are millions of long-lived objects; cyclic GC passes over them only cost time
+    gc.disable()
+    try:
+        report = validate_tree(args.data_dir, payload_sample=args.payload_sample, max_examples=args.max_examples, seed=args.seed)
+    except Exception as e:
+        print(f"\n[ERROR] {str(e)}")
+        print("\n")
+        sys.exit(2)
+
+    print_report(report, args.data_dir)
+    sys.exit(1 if report.issue_count else 0)